@@ -0,0 +1 @@
+"""Cross-day benchmark suite for the 2025 solvers. Run with `python -m benchmark`."""
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmarks every 2025 solver.
+
+Usage (from the 2025 directory):
+    python -m benchmark                                  # real inputs, 5 runs each
+    python -m benchmark --days 4 8 --repeat 10
+    python -m benchmark --inputs-dir scaled/x10          # also time a scaled input set
+    python -m benchmark --baseline baseline.json --max-regression 15
+
+Each solver's import time (python -X importtime, fresh interpreter) is reported
+as part 'import' and goes through the same regression gate as the solve times.
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+from pathlib import Path
+
+from benchmark.importtime import time_import
+from benchmark.registry import discover, solver_modules
+from benchmark.regression import check_regressions, load_results
+from benchmark.runner import time_part
+
+def format_row(record):
+    name = f"day{record['day']:02d}.{record['part']}"
+    if 'error' in record:
+        return f"{name:<26} {record['input']:<12} ERROR {record['error']}"
+    peak = f"{record['peak_rss_kb'] / 1024:>9.1f}" if 'peak_rss_kb' in record else f"{'-':>9}"
+    row = (
+        f"{name:<26} {record['input']:<12} "
+        f"{record['min'] * 1000:>10.2f} {record['median'] * 1000:>10.2f} {record['p95'] * 1000:>10.2f} {peak}"
+    )
+    if record.get('heaviest'):
+        row += "   " + ", ".join(f"{mod} {seconds * 1000:.1f}" for mod, seconds in record['heaviest'])
+    return row
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmark', description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, nargs='+', help='only benchmark these days')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per part (default 5)')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs before timing (default 1)')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds allowed per part (default 600)')
+    parser.add_argument('--inputs-dir', type=Path, action='append', default=[],
+                        help='extra directory of day_XX.txt files to time (repeatable)')
+    parser.add_argument('--no-real', action='store_true', help='skip the real inputs in inputs/')
+    parser.add_argument('--no-imports', action='store_true', help='skip the -X importtime startup report')
+    parser.add_argument('--output', type=Path, default=Path('benchmark_results.json'),
+                        help='where to write the JSON results (default benchmark_results.json)')
+    parser.add_argument('--baseline', type=Path, help='results JSON to compare against')
+    parser.add_argument('--max-regression', type=float, default=10.0,
+                        help='allowed median slowdown vs baseline in percent (default 10)')
+    parser.add_argument('--noise-floor', type=float, default=1.0,
+                        help='ignore parts whose baseline median is below this many ms (default 1)')
+    args = parser.parse_args(argv)
+
+    input_sets = ([] if args.no_real else [None]) + args.inputs_dir
+    parts = discover(set(args.days) if args.days else None)
+
+    print(f"{'part':<26} {'input':<12} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'peak MiB':>9}")
+    results = []
+    if not args.no_imports:
+        # Startup cost of each solver module; heaviest direct imports in ms at the end of the row
+        for day, module_name in solver_modules().items():
+            if args.days and day not in args.days:
+                continue
+            record = time_import(day, module_name, args.repeat)
+            print(format_row(record), flush=True)
+            results.append(record)
+
+    for inputs_dir in input_sets:
+        for part in parts:
+            record = time_part(part, inputs_dir, args.repeat, args.warmup, args.timeout)
+            print(format_row(record), flush=True)
+            results.append(record)
+
+    args.output.write_text(json.dumps({
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+        },
+        'results': results,
+    }, indent=2))
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        failures = check_regressions(results, load_results(args.baseline),
+                                     args.max_regression, args.noise_floor / 1000)
+        if failures:
+            print(f"\nREGRESSIONS vs {args.baseline}:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print(f"\nNo regressions vs {args.baseline} (limit {args.max_regression:g}%)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
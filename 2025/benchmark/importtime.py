@@ -0,0 +1,63 @@
+"""Import-time measurement of the solver modules via `python -X importtime`."""
+import re
+import subprocess
+import sys
+
+from benchmark.registry import ROOT_DIR
+from benchmark.runner import summarize
+
+LINE_RE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+def parse_importtime(stderr: str, module_name: str):
+    """Returns (cumulative us of module_name, [(child, cumulative us), ...] heaviest first).
+
+    -X importtime prints a module after everything it imported, with nested
+    imports indented by two spaces per level, so the direct children of
+    module_name are the lines one level deeper directly above it.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            entries.append((int(match.group(2)), len(match.group(3)) // 2, match.group(4)))
+
+    for idx in range(len(entries) - 1, -1, -1):
+        cumulative, level, name = entries[idx]
+        if name == module_name:
+            break
+    else:
+        raise ValueError(f"{module_name} not found in -X importtime output")
+
+    children = []
+    for child_cumulative, child_level, child_name in reversed(entries[:idx]):
+        if child_level <= level:
+            break
+        if child_level == level + 1:
+            children.append((child_name, child_cumulative))
+    children.sort(key=lambda c: -c[1])
+    return cumulative, children
+
+def time_import(day: int, module_name: str, repeat: int = 3, top: int = 3) -> dict:
+    """Imports module_name in `repeat` fresh interpreters and returns a result record.
+
+    The record has the same shape as the per-part timings (part 'import',
+    input 'startup') so the table and the regression gate handle it unchanged.
+    """
+    record = {'day': day, 'part': 'import', 'input': 'startup'}
+    times = []
+    heaviest = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+            cwd=ROOT_DIR, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            record['error'] = proc.stderr.strip().splitlines()[-1]
+            return record
+        cumulative_us, children = parse_importtime(proc.stderr, module_name)
+        times.append(cumulative_us / 1e6)
+        if cumulative_us / 1e6 <= min(times):
+            heaviest = children[:top]
+    record.update(summarize(times))
+    record.update({'times': times, 'heaviest': [[name, us / 1e6] for name, us in heaviest]})
+    return record
@@ -0,0 +1,79 @@
+"""Discovery of the solve_day_XX modules and their entry points."""
+import importlib
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT_DIR = Path(__file__).parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from utils.inputs import get_input_path
+
+# Entry point layouts, tried in order. Single-function layouts either return
+# a (part1, part2) tuple (day 11) or the one answer the day has (day 12).
+ENTRY_POINTS = [
+    ('solve_part1', 'solve_part2'),
+    ('solve', 'solve_part2'),
+    ('solve',),
+    ('solve_all',),
+]
+
+# Days whose solvers take the whole input as one string instead of lines
+TEXT_INPUT_DAYS = {2}
+
+# Alternative backends timed next to a day's regular entry points
+VARIANTS = {
+    4: ('solve_part2_worklist', 'solve_part1_bits', 'solve_part2_bits'),
+}
+
+# Extra positional arguments some entry points need beyond the input
+EXTRA_ARGS = {
+    (8, 'solve_part1'): (1000,),
+}
+
+class SolverPart(NamedTuple):
+    day: int
+    module: str
+    func: str
+    args: tuple
+
+    @property
+    def label(self) -> str:
+        return f"day{self.day:02d}.{self.func}"
+
+def solver_modules() -> dict[int, str]:
+    """Returns {day: module name} for every solve_day_XX.py next to this package."""
+    modules = {}
+    for path in sorted(ROOT_DIR.glob('solve_day_*.py')):
+        match = re.fullmatch(r'solve_day_(\d+)', path.stem)
+        if match:
+            modules[int(match.group(1))] = path.stem
+    return modules
+
+def entry_points(day: int, module) -> list[SolverPart]:
+    """Lists the parts of an imported solver module according to ENTRY_POINTS, plus its VARIANTS."""
+    for layout in ENTRY_POINTS:
+        if all(callable(getattr(module, name, None)) for name in layout):
+            names = layout + tuple(v for v in VARIANTS.get(day, ()) if callable(getattr(module, v, None)))
+            return [SolverPart(day, module.__name__, name, EXTRA_ARGS.get((day, name), ())) for name in names]
+    return []
+
+def discover(days=None) -> list[SolverPart]:
+    """Imports every solver module (optionally only the given days) and lists its timed parts."""
+    parts = []
+    for day, module_name in solver_modules().items():
+        if days and day not in days:
+            continue
+        parts.extend(entry_points(day, importlib.import_module(module_name)))
+    return parts
+
+def load_input(day: int, inputs_dir: Path | None = None):
+    """Loads a day's input in the shape its solvers expect (see utils.inputs.read_text/read_lines)."""
+    if inputs_dir is None:
+        path = get_input_path(day)
+    else:
+        path = Path(inputs_dir) / f"day_{day:02d}.txt"
+    text = path.read_text().strip()
+    return text if day in TEXT_INPUT_DAYS else text.splitlines()
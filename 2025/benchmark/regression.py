@@ -0,0 +1,36 @@
+"""Comparison of a benchmark run against a stored baseline."""
+import json
+from pathlib import Path
+
+def _key(record):
+    return record['day'], record['part'], record['input']
+
+def load_results(path: Path) -> list[dict]:
+    return json.loads(Path(path).read_text())['results']
+
+def check_regressions(results, baseline, max_regression_pct: float, noise_floor: float = 0.001):
+    """Returns a list of human readable failures for parts that got slower than allowed.
+
+    Medians are compared. Parts whose baseline median is below noise_floor seconds
+    are skipped since their timings are dominated by jitter. A part that errors now
+    but succeeded in the baseline is always a failure.
+    """
+    base = {_key(r): r for r in baseline}
+    failures = []
+    for record in results:
+        old = base.get(_key(record))
+        if old is None or 'median' not in old:
+            continue
+        label = f"day{record['day']:02d}.{record['part']} [{record['input']}]"
+        if 'median' not in record:
+            failures.append(f"{label}: {record.get('error', 'no timing')}")
+            continue
+        if old['median'] < noise_floor:
+            continue
+        change_pct = (record['median'] / old['median'] - 1) * 100
+        if change_pct > max_regression_pct:
+            failures.append(
+                f"{label}: median {old['median'] * 1000:.2f} ms -> {record['median'] * 1000:.2f} ms "
+                f"(+{change_pct:.1f}% > {max_regression_pct:g}%)"
+            )
+    return failures
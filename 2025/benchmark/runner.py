@@ -0,0 +1,104 @@
+"""Timing of individual solver parts.
+
+Every (part, input set) pair is measured in a freshly spawned process so that
+peak RSS belongs to that part alone and no import or cache state leaks from one
+measurement into the next.
+"""
+import gc
+import importlib
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+from benchmark.registry import SolverPart, load_input
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted, non-empty sequence."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        'min': ordered[0],
+        'median': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+    }
+
+def peak_rss_kb() -> int:
+    """High-water RSS of this process in KiB.
+
+    Linux carries ru_maxrss over from the parent across fork/exec, which would
+    credit a freshly spawned child with the parent's footprint, so VmHWM from
+    /proc is preferred where available.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    # ru_maxrss is in KiB on Linux but in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss // 1024 if sys.platform == 'darwin' else maxrss
+
+def _measure(part: SolverPart, inputs_dir, repeat: int, warmup: int):
+    # Runs inside the child process
+    func = getattr(importlib.import_module(part.module), part.func)
+    data = load_input(part.day, inputs_dir)
+
+    answer = None
+    for _ in range(warmup):
+        answer = func(data, *part.args)
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        answer = func(data, *part.args)
+        times.append(time.perf_counter() - start)
+
+    return times, peak_rss_kb(), repr(answer)
+
+def _child(conn, part, inputs_dir, repeat, warmup):
+    try:
+        conn.send(('ok', _measure(part, inputs_dir, repeat, warmup)))
+    except Exception as e:
+        conn.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def time_part(part: SolverPart, inputs_dir: Path | None = None, repeat: int = 5,
+              warmup: int = 1, timeout: float | None = None) -> dict:
+    """Times one solver part in a fresh process and returns its result record."""
+    ctx = multiprocessing.get_context('spawn')
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(child_conn, part, inputs_dir, repeat, warmup))
+    proc.start()
+    child_conn.close()
+
+    record = {
+        'day': part.day,
+        'part': part.func,
+        'input': 'real' if inputs_dir is None else Path(inputs_dir).name,
+    }
+    if parent_conn.poll(timeout):
+        try:
+            status, payload = parent_conn.recv()
+        except EOFError:
+            status, payload = 'error', 'worker process died'
+    else:
+        proc.terminate()
+        status, payload = 'error', f"timed out after {timeout}s"
+    proc.join()
+
+    if status == 'ok':
+        times, peak_kb, answer = payload
+        record.update(summarize(times))
+        record.update({'times': times, 'peak_rss_kb': peak_kb, 'answer': answer})
+    else:
+        record['error'] = payload
+    return record
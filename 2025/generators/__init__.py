@@ -0,0 +1,40 @@
+"""Seeded synthetic input generators for the 2025 puzzles.
+
+Each `generators.day_XX` module exposes:
+
+    DEFAULTS              keyword arguments that roughly match the real input's size
+    scaled(scale)         DEFAULTS grown so the input is about `scale` times larger
+    generate(rng, **kw)   yields the input file as text fragments (newlines included)
+
+Fragments rather than whole strings keep memory flat for multi-gigabyte outputs.
+Files are written as `<out_dir>/day_XX.txt`, the same layout as `inputs/`, so
+`AOC_INPUTS_DIR=<out_dir> python solve_day_XX.py` runs a solver on them unchanged.
+"""
+import importlib
+import random
+from pathlib import Path
+
+def load(day: int):
+    return importlib.import_module(f"generators.day_{day:02d}")
+
+def write_input(day: int, out_dir: Path, seed: int = 0, scale: float = 1.0, **overrides) -> Path:
+    """Generates one day's input into out_dir and returns the written path."""
+    module = load(day)
+    params = module.scaled(scale)
+    params.update(overrides)
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"day_{day:02d}.txt"
+    rng = random.Random(seed)
+    with path.open('w') as f:
+        for fragment in module.generate(rng, **params):
+            f.write(fragment)
+    return path
+
+def scale_count(value: int, scale: float) -> int:
+    return max(1, round(value * scale))
+
+def scale_side(value: int, scale: float) -> int:
+    # For 2D inputs: grow each side by sqrt(scale) so the cell count grows by scale
+    return max(1, round(value * scale ** 0.5))
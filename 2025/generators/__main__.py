@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Writes scaled synthetic inputs for the 2025 solvers.
+
+Usage (from the 2025 directory):
+    python -m generators --out scaled/x10 --scale 10
+    python -m generators --out scaled/grid --days 4 --param rows=20000 --param cols=20000
+    AOC_INPUTS_DIR=scaled/x10 python solve_day_04.py
+"""
+import argparse
+import ast
+import sys
+from pathlib import Path
+
+from generators import load, write_input
+
+ALL_DAYS = range(1, 13)
+
+def parse_param(text):
+    name, _, value = text.partition('=')
+    if not name or not value:
+        raise argparse.ArgumentTypeError(f"expected NAME=VALUE, got {text!r}")
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m generators', description=__doc__.splitlines()[0])
+    parser.add_argument('--out', type=Path, required=True, help='directory to write day_XX.txt files into')
+    parser.add_argument('--days', type=int, nargs='+', default=list(ALL_DAYS), help='days to generate (default all)')
+    parser.add_argument('--scale', type=float, default=1.0, help='size relative to the real input (default 1)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default 0)')
+    parser.add_argument('--param', type=parse_param, action='append', default=[],
+                        help='override a generator parameter, e.g. --param rows=5000 (repeatable)')
+    args = parser.parse_args(argv)
+
+    overrides = dict(args.param)
+    for day in args.days:
+        accepted = {k: v for k, v in overrides.items() if k in load(day).DEFAULTS}
+        path = write_input(day, args.out, args.seed, args.scale, **accepted)
+        print(f"Day {day:2d}: {path} ({path.stat().st_size:,} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
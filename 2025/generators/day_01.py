@@ -0,0 +1,11 @@
+"""Day 1: a log of dial rotations, one `L<n>` / `R<n>` per line."""
+from generators import scale_count
+
+DEFAULTS = {'n': 4779, 'max_amount': 999}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, max_amount):
+    for _ in range(n):
+        yield f"{rng.choice('LR')}{rng.randint(1, max_amount)}\n"
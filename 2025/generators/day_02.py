@@ -0,0 +1,23 @@
+"""Day 2: comma separated `start-end` product ID ranges."""
+from generators import scale_count
+
+DEFAULTS = {'n': 38, 'digits': 8, 'span': 100000}
+
+# The solvers drop newlines before splitting on commas, so long range lists
+# are wrapped to keep individual lines short.
+RANGES_PER_LINE = 1000
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, digits, span):
+    """n ranges whose start has `digits` digits and that cover up to `span` IDs each."""
+    low = 10 ** (digits - 1)
+    high = 10 ** digits - 1
+    for i in range(n):
+        start = rng.randint(low, high)
+        end = start + rng.randint(0, span - 1)
+        sep = '' if i == n - 1 else ','
+        if i == n - 1 or (i + 1) % RANGES_PER_LINE == 0:
+            sep += '\n'
+        yield f"{start}-{end}{sep}"
@@ -0,0 +1,11 @@
+"""Day 3: battery banks, one line of digits 1-9 per bank."""
+from generators import scale_count
+
+DEFAULTS = {'n': 200, 'length': 100}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, length):
+    for _ in range(n):
+        yield ''.join(rng.choices('123456789', k=length)) + '\n'
@@ -0,0 +1,11 @@
+"""Day 4: an R x C grid of paper rolls (`@`) and empty floor (`.`)."""
+from generators import scale_side
+
+DEFAULTS = {'rows': 137, 'cols': 137, 'density': 0.65}
+
+def scaled(scale):
+    return {**DEFAULTS, 'rows': scale_side(DEFAULTS['rows'], scale), 'cols': scale_side(DEFAULTS['cols'], scale)}
+
+def generate(rng, rows, cols, density):
+    for _ in range(rows):
+        yield ''.join('@' if rng.random() < density else '.' for _ in range(cols)) + '\n'
@@ -0,0 +1,19 @@
+"""Day 5: fresh ingredient ID ranges, a blank line, then ingredient IDs."""
+from generators import scale_count
+
+DEFAULTS = {'n_ranges': 181, 'n_ids': 1000, 'max_id': 10 ** 15 // 2, 'span': 10 ** 13}
+
+def scaled(scale):
+    return {
+        **DEFAULTS,
+        'n_ranges': scale_count(DEFAULTS['n_ranges'], scale),
+        'n_ids': scale_count(DEFAULTS['n_ids'], scale),
+    }
+
+def generate(rng, n_ranges, n_ids, max_id, span):
+    for _ in range(n_ranges):
+        start = rng.randint(1, max_id)
+        yield f"{start}-{start + rng.randint(0, span)}\n"
+    yield "\n"
+    for _ in range(n_ids):
+        yield f"{rng.randint(1, max_id)}\n"
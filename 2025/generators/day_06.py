@@ -0,0 +1,29 @@
+"""Day 6: a worksheet of side-by-side problems, operator on the bottom row.
+
+Each problem is a block of `rows` numbers stacked vertically, left or right
+aligned within the block and followed by one blank separator column.
+"""
+import random
+
+from generators import scale_count
+
+DEFAULTS = {'n': 1000, 'rows': 4, 'max_digits': 4}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def _block(seed, idx, rows, max_digits):
+    # Each block comes from its own RNG so rows can be written one at a time
+    # without holding the whole worksheet in memory.
+    rng = random.Random(f"{seed}:{idx}")
+    nums = [str(rng.randint(1, 10 ** rng.randint(1, max_digits) - 1)) for _ in range(rows)]
+    width = max(len(s) for s in nums)
+    align = str.ljust if rng.random() < 0.5 else str.rjust
+    return [align(s, width) for s in nums] + [rng.choice('+*').ljust(width)]
+
+def generate(rng, n, rows, max_digits):
+    seed = rng.getrandbits(64)
+    for r in range(rows + 1):
+        for idx in range(n):
+            yield _block(seed, idx, rows, max_digits)[r]
+            yield '\n' if idx == n - 1 else ' '
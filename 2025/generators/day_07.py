@@ -0,0 +1,16 @@
+"""Day 7: a tachyon manifold, `S` on the top row and `^` splitters on even rows."""
+from generators import scale_side
+
+DEFAULTS = {'rows': 142, 'cols': 141, 'density': 0.15}
+
+def scaled(scale):
+    return {**DEFAULTS, 'rows': scale_side(DEFAULTS['rows'], scale), 'cols': scale_side(DEFAULTS['cols'], scale)}
+
+def generate(rng, rows, cols, density):
+    start = cols // 2
+    yield '.' * start + 'S' + '.' * (cols - start - 1) + '\n'
+    for r in range(1, rows):
+        if r % 2:
+            yield '.' * cols + '\n'
+        else:
+            yield ''.join('^' if rng.random() < density else '.' for _ in range(cols)) + '\n'
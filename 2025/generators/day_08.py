@@ -0,0 +1,11 @@
+"""Day 8: junction box positions, one `x,y,z` per line."""
+from generators import scale_count
+
+DEFAULTS = {'n': 1000, 'max_coord': 100000}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, max_coord):
+    for _ in range(n):
+        yield f"{rng.randrange(max_coord)},{rng.randrange(max_coord)},{rng.randrange(max_coord)}\n"
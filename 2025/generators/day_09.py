@@ -0,0 +1,39 @@
+"""Day 9: red tiles at the corners of a simple rectilinear polygon, in order.
+
+The polygon is a band between two random skylines over the same increasing x
+breakpoints: the top skyline is walked left to right, the bottom one right to
+left. Keeping every bottom height below every top height makes it simple.
+"""
+from generators import scale_count
+
+DEFAULTS = {'n': 496, 'max_coord': 100000}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def _heights(rng, count, low, high):
+    # Neighbouring heights differ so every vertex is a real corner
+    heights = [rng.randint(low, high)]
+    for _ in range(count - 1):
+        h = rng.randint(low, high - 1)
+        heights.append(h + 1 if h >= heights[-1] else h)
+    return heights
+
+def generate(rng, n, max_coord):
+    """Yields about n vertices (rounded up to a multiple of 4)."""
+    m = max(1, -(-n // 4))
+    mid = max_coord // 2
+    xs = sorted(rng.sample(range(max_coord), m + 1))
+    top = _heights(rng, m, mid + 1, max_coord)
+    bottom = _heights(rng, m, 0, mid - 1)
+
+    yield f"{xs[0]},{top[0]}\n"
+    for i in range(1, m):
+        yield f"{xs[i]},{top[i - 1]}\n"
+        yield f"{xs[i]},{top[i]}\n"
+    yield f"{xs[m]},{top[m - 1]}\n"
+    yield f"{xs[m]},{bottom[m - 1]}\n"
+    for i in range(m - 1, 0, -1):
+        yield f"{xs[i]},{bottom[i]}\n"
+        yield f"{xs[i]},{bottom[i - 1]}\n"
+    yield f"{xs[0]},{bottom[0]}\n"
@@ -0,0 +1,37 @@
+"""Day 10: factory machines, `[lights] (button) ... {joltages}` per line.
+
+Targets are built from random button presses so every machine is solvable.
+"""
+from generators import scale_count
+
+DEFAULTS = {'n': 193, 'max_lights': 10, 'max_presses': 30}
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, max_lights, max_presses):
+    for _ in range(n):
+        num_lights = rng.randint(3, max_lights)
+        buttons = [
+            sorted(rng.sample(range(num_lights), rng.randint(1, num_lights - 1)))
+            for _ in range(rng.randint(num_lights - 1, num_lights + 3))
+        ]
+        # Make sure every counter is wired to at least one button
+        for light in range(num_lights):
+            if not any(light in b for b in buttons):
+                buttons[rng.randrange(len(buttons))].append(light)
+                buttons = [sorted(b) for b in buttons]
+
+        lights = [False] * num_lights
+        joltages = [0] * num_lights
+        for b in buttons:
+            if rng.random() < 0.5:
+                for light in b:
+                    lights[light] = not lights[light]
+            presses = rng.randint(0, max_presses)
+            for light in b:
+                joltages[light] += presses
+
+        pattern = ''.join('#' if on else '.' for on in lights)
+        wiring = ' '.join(f"({','.join(map(str, b))})" for b in buttons)
+        yield f"[{pattern}] {wiring} {{{','.join(map(str, joltages))}}}\n"
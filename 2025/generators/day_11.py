@@ -0,0 +1,59 @@
+"""Day 11: a device DAG, `name: out1 out2 ...` per line.
+
+Nodes are laid out in a random topological order with `svr` and `you` near the
+start, `fft` and `dac` in the middle and `out` last, so both parts have paths.
+"""
+import string
+
+from generators import scale_count
+
+DEFAULTS = {'nodes': 554, 'edges': 1700}
+
+SPECIAL = ('svr', 'you', 'fft', 'dac', 'out')
+
+def scaled(scale):
+    return {
+        **DEFAULTS,
+        'nodes': scale_count(DEFAULTS['nodes'], scale),
+        'edges': scale_count(DEFAULTS['edges'], scale),
+    }
+
+def _names(count):
+    width = 3
+    while 26 ** width < count + len(SPECIAL):
+        width += 1
+    names = []
+    i = 0
+    while len(names) < count:
+        name = ''
+        v = i
+        for _ in range(width):
+            v, d = divmod(v, 26)
+            name += string.ascii_lowercase[d]
+        if name not in SPECIAL:
+            names.append(name)
+        i += 1
+    return names
+
+def generate(rng, nodes, edges):
+    v = max(nodes, len(SPECIAL) + 2)
+    order = _names(v - len(SPECIAL))
+    rng.shuffle(order)
+    order.insert(0, 'svr')
+    order.insert(1, 'you')
+    order.insert(v // 3, 'fft')
+    order.insert(2 * v // 3, 'dac')
+    order.append('out')
+
+    # A spine keeps everything reachable, remaining edges go forward at random
+    adj = [set() for _ in range(v)]
+    for i in range(v - 1):
+        adj[i].add(i + 1)
+    for _ in range(max(0, edges - (v - 1))):
+        i = rng.randrange(v - 1)
+        adj[i].add(rng.randrange(i + 1, v))
+
+    for i in range(v - 1):
+        outs = sorted(adj[i])
+        rng.shuffle(outs)
+        yield f"{order[i]}: {' '.join(order[j] for j in outs)}\n"
@@ -0,0 +1,43 @@
+"""Day 12: present shapes followed by `WxH: count0 count1 ...` region queries."""
+from generators import scale_count
+
+DEFAULTS = {'n': 1000, 'min_side': 35, 'max_side': 50, 'fit_fraction': 0.46}
+
+# Like the real input, regions are either comfortably loose or over-full by
+# area; fills in between make the backtracking search blow up.
+LOOSE_FILL = (0.6, 0.78)
+OVERFULL_FILL = (1.02, 1.08)
+
+# The six 3x3 shapes from the real input
+SHAPES = [
+    ["###", "..#", "###"],
+    [".##", "##.", "#.."],
+    ["###", ".##", ".##"],
+    ["#.#", "###", "#.#"],
+    ["#..", "##.", "###"],
+    ["##.", ".##", "###"],
+]
+
+def scaled(scale):
+    return {**DEFAULTS, 'n': scale_count(DEFAULTS['n'], scale)}
+
+def generate(rng, n, min_side, max_side, fit_fraction):
+    """n queries, about fit_fraction of them loose enough to pack."""
+    for idx, rows in enumerate(SHAPES):
+        yield f"{idx}:\n" + '\n'.join(rows) + "\n\n"
+
+    areas = [sum(row.count('#') for row in rows) for rows in SHAPES]
+    for _ in range(n):
+        w = rng.randint(min_side, max_side)
+        h = rng.randint(min_side, max_side)
+        fill = LOOSE_FILL if rng.random() < fit_fraction else OVERFULL_FILL
+        budget = w * h * rng.uniform(*fill)
+        counts = [0] * len(SHAPES)
+        used = 0
+        while True:
+            i = rng.randrange(len(SHAPES))
+            if used + areas[i] > budget:
+                break
+            counts[i] += 1
+            used += areas[i]
+        yield f"{w}x{h}: {' '.join(map(str, counts))}\n"
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Runs every solve_day_XX.py in parallel and caches the answers.
+
+Answers are cached per day under a key made from the SHA-256 of the solver's
+source (together with every local module it imports, e.g. utils.union_find)
+and of its input file, so a day is only recomputed when one of those changes
+(or when --force asks for it). A day whose input is missing is reported as an
+error row instead of aborting the run.
+
+Usage (from the 2025 directory):
+    python run_all.py                 # everything, cached days come back instantly
+    python run_all.py --only 4 8      # just days 4 and 8
+    python run_all.py --force 12      # recompute day 12 even if cached
+    python run_all.py --force         # recompute everything
+"""
+import argparse
+import ast
+import concurrent.futures
+import hashlib
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from benchmark.registry import ROOT_DIR, entry_points, load_input, solver_modules
+from utils.inputs import get_input_path
+
+CACHE_DIR = ROOT_DIR / ".cache" / "answers"
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def local_module_path(name: str) -> Path | None:
+    """Maps a dotted module name to its file under ROOT_DIR, or None if it isn't local."""
+    base = ROOT_DIR.joinpath(*name.split('.'))
+    for path in (base.with_suffix('.py'), base / '__init__.py'):
+        if path.is_file():
+            return path
+    return None
+
+def local_sources(module_name: str) -> list[Path]:
+    """The solver's file plus every local module it (transitively) imports, sorted."""
+    seen = set()
+    stack = [local_module_path(module_name)]
+    while stack:
+        path = stack.pop()
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        # ast.walk also sees the imports deferred into function bodies
+        for node in ast.walk(ast.parse(path.read_bytes())):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                # Importing utils.union_find also runs the package __init__
+                parts = name.split('.')
+                stack.extend(local_module_path('.'.join(parts[:i])) for i in range(1, len(parts) + 1))
+    return sorted(seen)
+
+def source_sha256(module_name: str) -> str:
+    digest = hashlib.sha256()
+    for path in local_sources(module_name):
+        digest.update(path.relative_to(ROOT_DIR).as_posix().encode() + b'\0')
+        digest.update(file_sha256(path).encode())
+    return digest.hexdigest()
+
+def cache_path(module_name: str, day: int) -> Path:
+    source_hash = source_sha256(module_name)
+    input_hash = file_sha256(get_input_path(day))
+    return CACHE_DIR / f"{module_name}-{source_hash[:16]}-{input_hash[:16]}.json"
+
+def solve_day(day: int, module_name: str) -> list[dict]:
+    """Runs every part of one day. Executed in a worker process."""
+    module = importlib.import_module(module_name)
+    data = load_input(day)
+    results = []
+    for part in entry_points(day, module):
+        start = time.perf_counter()
+        answer = getattr(module, part.func)(data, *part.args)
+        results.append({
+            'part': part.func,
+            'answer': repr(answer),
+            'seconds': time.perf_counter() - start,
+        })
+    return results
+
+def print_table(rows):
+    width = max([12] + [len(row[1]) for row in rows])
+    print(f"{'day':>3}  {'part':<{width}} {'answer':<44} {'time ms':>10}  source")
+    for day, part, answer, seconds, source in rows:
+        print(f"{day:>3}  {part:<{width}} {answer:<44} {seconds * 1000:>10.2f}  {source}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--only', type=int, nargs='+', help='only run these days')
+    parser.add_argument('--force', type=int, nargs='*',
+                        help='ignore the cache for these days (all days if none given)')
+    parser.add_argument('--workers', type=int, help='process pool size (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    modules = {d: m for d, m in solver_modules().items() if not args.only or d in args.only}
+    forced = set(modules) if args.force == [] else set(args.force or [])
+
+    wall_start = time.perf_counter()
+    results = {}
+    pending = {}
+    for day, module_name in modules.items():
+        try:
+            path = cache_path(module_name, day)
+        except OSError as e:
+            results[day] = ([{'part': '-', 'answer': f"ERROR {type(e).__name__}: {e}", 'seconds': 0.0}], 'error')
+            continue
+        if day not in forced and path.exists():
+            results[day] = (json.loads(path.read_text()), 'cache')
+        else:
+            pending[day] = path
+
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(args.workers) as pool:
+            futures = {pool.submit(solve_day, day, modules[day]): day for day in pending}
+            for future in concurrent.futures.as_completed(futures):
+                day = futures[future]
+                try:
+                    parts = future.result()
+                except Exception as e:
+                    results[day] = ([{'part': '-', 'answer': f"ERROR {type(e).__name__}: {e}", 'seconds': 0.0}], 'error')
+                    continue
+                pending[day].parent.mkdir(parents=True, exist_ok=True)
+                pending[day].write_text(json.dumps(parts, indent=2))
+                results[day] = (parts, 'solved')
+
+    rows = []
+    for day in sorted(results):
+        parts, source = results[day]
+        for part in parts:
+            rows.append((day, part['part'], part['answer'], part['seconds'], source))
+    print_table(rows)
+    sources = [source for _, source in results.values()]
+    print(f"\n{len(modules)} days, {sources.count('solved')} solved, {sources.count('cache')} cached, "
+          f"{sources.count('error')} failed in {time.perf_counter() - wall_start:.2f}s")
+    return 1 if any(source == 'error' for _, source in results.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import sys
-from utils.inputs import read_lines
+from utils.inputs import iter_chunks
+from utils.profiling import profiled
 
+@profiled
 def solve_part1(lines):
     current_pos = 50
     zero_count = 0
@@ -23,6 +25,7 @@ def solve_part1(lines):
             
     return zero_count
 
+@profiled
 def solve_part2(lines):
     current_pos = 50
     total_zeros = 0
@@ -51,9 +54,80 @@ def solve_part2(lines):
             
     return total_zeros
 
+# --- Vectorized mode ---
+# numpy is imported inside these functions so the line-by-line path above
+# keeps a fast startup.
+
+@profiled
+def parse_rotations(data):
+    """Parses a block of `L<n>` / `R<n>` lines (str or bytes) into a signed int64 array, L negative."""
+    import numpy as np
+    
+    if isinstance(data, str):
+        data = data.encode()
+    buf = np.frombuffer(data, dtype=np.uint8)
+    dir_pos = np.flatnonzero((buf == ord('L')) | (buf == ord('R')))
+    
+    # Horner's rule over all lines at once, one digit column per iteration,
+    # so the loop runs once per digit of the longest amount, not per line
+    amounts = np.zeros(len(dir_pos), dtype=np.int64)
+    active = np.ones(len(dir_pos), dtype=bool)
+    offset = 1
+    while active.any():
+        idx = dir_pos + offset
+        in_range = idx < len(buf)
+        digit = buf[np.where(in_range, idx, 0)].astype(np.int64) - ord('0')
+        active &= in_range & (digit >= 0) & (digit <= 9)
+        amounts = np.where(active, amounts * 10 + digit, amounts)
+        offset += 1
+        
+    signs = np.where(buf[dir_pos] == ord('L'), -1, 1)
+    return signs * amounts
+
+@profiled
+def count_zeros(steps, start=50):
+    """Returns (part 1 count, part 2 count, final position) for a signed step array.
+    
+    Works on the unwrapped dial position P = start + cumsum(steps). Moving right
+    from P to Q clicks through 0 once per multiple of 100 in (P, Q], moving left
+    once per multiple of 100 in [Q, P). Both are differences of floor divisions,
+    which are the same formulas solve_part2 applies one line at a time.
+    """
+    import numpy as np
+    
+    positions = start + np.cumsum(steps, dtype=np.int64)
+    prev = np.empty_like(positions)
+    prev[:1] = start
+    prev[1:] = positions[:-1]
+    
+    stops = int(np.count_nonzero(positions % 100 == 0))
+    
+    right = steps > 0
+    passes = np.where(
+        right,
+        positions // 100 - prev // 100,
+        (prev - 1) // 100 - (positions - 1) // 100,
+    )
+    end = int(positions[-1] % 100) if len(positions) else start
+    return stops, int(passes.sum()), end
+
+def solve_chunks(chunks, start=50):
+    """Solves both parts over an iterable of input chunks (e.g. utils.inputs.iter_chunks).
+    
+    Chunks must end on line boundaries. Only one chunk is held at a time and the
+    dial position is carried from chunk to chunk, so memory stays constant.
+    """
+    part1 = 0
+    part2 = 0
+    pos = start
+    for chunk in chunks:
+        stops, passes, pos = count_zeros(parse_rotations(chunk), pos)
+        part1 += stops
+        part2 += passes
+    return part1, part2
+
 if __name__ == "__main__":
     print("--- Day 1: Secret Entrance ---")
-    input_data = read_lines(1)
-    
-    print(f"Part 1 Answer: {solve_part1(input_data)}")
-    print(f"Part 2 Answer: {solve_part2(input_data)}")
+    p1, p2 = solve_chunks(iter_chunks(1))
+    print(f"Part 1 Answer: {p1}")
+    print(f"Part 2 Answer: {p2}")
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import sys
 from utils.inputs import read_text
+from utils.profiling import profiled
+
+# Reference checks, one number at a time. The solvers below never call these,
+# they are only used to cross-check the closed-form engine on small ranges.
 
 def is_invalid(n):
     s = str(n)
@@ -9,19 +13,6 @@ def is_invalid(n):
     mid = len(s) // 2
     return s[:mid] == s[mid:]
 
-def solve_part1(input_str):
-    ranges = input_str.strip().replace('\n', '').split(',')
-    total_invalid_sum = 0
-    
-    for r in ranges:
-        if not r: continue
-        start, end = map(int, r.split('-'))
-        for i in range(start, end + 1):
-            if is_invalid(i):
-                total_invalid_sum += i
-                
-    return total_invalid_sum
-
 def is_invalid_part2(n):
     s = str(n)
     length = len(s)
@@ -35,22 +26,109 @@ def is_invalid_part2(n):
                 return True
     return False
 
-def solve_part2(input_str):
-    ranges = input_str.strip().replace('\n', '').split(',')
-    total_invalid_sum = 0
-    
-    for r in ranges:
+# --- Closed-form engine ---
+# A number of total_len digits that is a pattern of pattern_len digits repeated
+# total_len / pattern_len times is exactly p * M, where p is the pattern (no
+# leading zero) and M = 11..1 in base 10**pattern_len, the repunit multiplier.
+# The matches inside a range are therefore a run of consecutive p values and
+# their sum is M times an arithmetic series. Work scales with digit count only.
+
+def parse_ranges(input_str):
+    ranges = []
+    for r in input_str.strip().replace('\n', '').split(','):
         if not r: continue
         start, end = map(int, r.split('-'))
-        for i in range(start, end + 1):
-            if is_invalid_part2(i):
-                total_invalid_sum += i
-                
-    return total_invalid_sum
+        ranges.append((start, end))
+    return ranges
+
+def repunit_multiplier(total_len, pattern_len):
+    return (10 ** total_len - 1) // (10 ** pattern_len - 1)
+
+def pattern_bounds(start, end, total_len, pattern_len):
+    # Smallest and largest pattern p with start <= p * M <= end (lo > hi if none)
+    mult = repunit_multiplier(total_len, pattern_len)
+    lo = max(10 ** (pattern_len - 1), -(-start // mult))
+    hi = min(10 ** pattern_len - 1, end // mult)
+    return lo, hi, mult
+
+def sum_repeated(start, end, total_len, pattern_len):
+    lo, hi, mult = pattern_bounds(start, end, total_len, pattern_len)
+    if lo > hi:
+        return 0
+    return mult * (lo + hi) * (hi - lo + 1) // 2
+
+def prime_factors(n):
+    factors = []
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            factors.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def sum_invalid(start, end, any_repeat):
+    """Sums the invalid IDs in [start, end].
+    
+    Part 1 (any_repeat=False) only counts a pattern repeated exactly twice.
+    Part 2 counts any pattern repeated at least twice. Every proper period of a
+    total_len digit number divides total_len / q for some prime q | total_len,
+    and the numbers with periods a and b are exactly those with period gcd(a, b),
+    so inclusion-exclusion over the prime divisors of the length counts each
+    number once.
+    """
+    total = 0
+    for total_len in range(len(str(start)), len(str(end)) + 1):
+        if not any_repeat:
+            if total_len % 2 == 0:
+                total += sum_repeated(start, end, total_len, total_len // 2)
+            continue
+            
+        primes = prime_factors(total_len)
+        for mask in range(1, 1 << len(primes)):
+            divisor = 1
+            for i, q in enumerate(primes):
+                if mask >> i & 1:
+                    divisor *= q
+            sign = 1 if bin(mask).count('1') % 2 else -1
+            total += sign * sum_repeated(start, end, total_len, total_len // divisor)
+    return total
+
+@profiled
+def solve_part1(input_str):
+    return sum(sum_invalid(start, end, False) for start, end in parse_ranges(input_str))
+
+@profiled
+def solve_part2(input_str):
+    return sum(sum_invalid(start, end, True) for start, end in parse_ranges(input_str))
+
+def brute_force_sum(input_str, check):
+    return sum(i for start, end in parse_ranges(input_str) for i in range(start, end + 1) if check(i))
 
 if __name__ == "__main__":
     print("--- Day 2: Gift Shop ---")
-    input_data = read_text(2)
     
-    print(f"Part 1 Answer: {solve_part1(input_data)}")
-    print(f"Part 2 Answer: {solve_part2(input_data)}")
+    # Verification
+    example_input = (
+        "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,"
+        "1698522-1698528,446443-446449,38593856-38593862,565653-565659,"
+        "824824821-824824827,2121212118-2121212124"
+    )
+    
+    print("--- Verification ---")
+    p1_ex = solve_part1(example_input)
+    print(f"Part 1 Example: {p1_ex} (Expected 1227775554, brute force {brute_force_sum(example_input, is_invalid)})")
+    
+    p2_ex = solve_part2(example_input)
+    print(f"Part 2 Example: {p2_ex} (Expected 4174379265, brute force {brute_force_sum(example_input, is_invalid_part2)})")
+    
+    if p1_ex == 1227775554 and p2_ex == 4174379265:
+        print("\n--- Solving Real Input ---")
+        input_data = read_text(2)
+        print(f"Part 1 Answer: {solve_part1(input_data)}")
+        print(f"Part 2 Answer: {solve_part2(input_data)}")
+    else:
+        print("Verification FAILED.")
@@ -1,57 +1,105 @@
 #!/usr/bin/env python3
-import os
+from utils.inputs import get_input_path, iter_lines
+from utils.profiling import profiled
 
+@profiled
 def find_max_subsequence(line, target_length):
+    # Largest number formed by keeping target_length digits of line in order.
+    # Monotonic stack: a digit evicts smaller digits before it while we can
+    # still afford to drop digits, which keeps the first occurrence of the
+    # maximum for every output position. O(n) and no slicing of the input.
+    if isinstance(line, str):
+        line = line.encode()
     line = line.strip()
     if len(line) < target_length:
         return 0 # Or handle error appropriately
         
-    current_idx = 0
-    result = ""
-    
-    # We need to build a number of 'target_length' digits.
-    # For each position k (from target_length down to 1):
-    for k in range(target_length, 0, -1):
-        # We must leave at least (k - 1) digits after the one we pick now.
-        # So we can search up to index: len(line) - k
-        # In Python slice [start:end], end is exclusive, so we use len(line) - (k - 1)
-        search_end = len(line) - (k - 1)
-        
-        # Search range
-        chunk = line[current_idx : search_end]
-        
-        # Find max digit - strictly looking for '9' first is optimization
-        # We want the First occurrence of the maximum digit in this chunk.
-        max_d = '0'
-        max_rel_idx = -1
-        
-        for i, char in enumerate(chunk):
-            if char > max_d:
-                max_d = char
-                max_rel_idx = i
-                if char == '9': # Optimization
-                    break
-                    
-        result += max_d
-        current_idx += max_rel_idx + 1
+    drop = len(line) - target_length
+    stack = []
+    for d in line:
+        while drop and stack and stack[-1] < d:
+            stack.pop()
+            drop -= 1
+        stack.append(d)
         
-    return int(result)
+    return int(bytes(stack[:target_length]))
+
+@profiled
+def solve_both(input_data, target_lengths=(2, 12)):
+    # One pass over the input for every target length
+    totals = [0] * len(target_lengths)
+    for line in input_data:
+        line = line.strip()
+        if not line:
+            continue
+        for i, k in enumerate(target_lengths):
+            totals[i] += find_max_subsequence(line, k)
+    return tuple(totals)
+
+@profiled
+def solve_part1(input_data):
+    return solve_both(input_data, (2,))[0]
+
+@profiled
+def solve_part2(input_data):
+    return solve_both(input_data, (12,))[0]
 
-def solve_part1(input_path):
-    total = 0
-    with open(input_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                total += find_max_subsequence(line, 2)
-    return total
+# --- Batched mode ---
 
-def solve_part2(input_path):
-    total = 0
-    with open(input_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                total += find_max_subsequence(line, 12)
-    return total
+def max_subsequence_batch(digits, target_length):
+    """Vectorized find_max_subsequence for a (rows, n) uint8 matrix of digit values.
+    
+    Runs the greedy choice once per output digit for all rows at once: mask
+    each row's window [cur, n - remaining] and take the first argmax. Returns
+    an int64 array (object array of Python ints past 18 digits).
+    """
+    import numpy as np
+    
+    rows, n = digits.shape
+    if n < target_length:
+        return np.zeros(rows, dtype=np.int64)
+    # Signed so masked-out cells can sit below every digit
+    digits = digits.astype(np.int8, copy=False)
+        
+    result = np.zeros(rows, dtype=np.int64 if target_length <= 18 else object)
+    row_idx = np.arange(rows)
+    cols = np.arange(n)
+    cur = np.zeros(rows, dtype=np.intp)
+    for j in range(target_length):
+        lo = int(cur.min())
+        hi = n - (target_length - j) + 1
+        window = np.where(cols[lo:hi] >= cur[:, None], digits[:, lo:hi], -1)
+        pick = window.argmax(axis=1) + lo
+        result = result * 10 + digits[row_idx, pick]
+        cur = pick + 1
+    return result
+
+@profiled
+def solve_batched(input_data, target_lengths=(2, 12), batch_rows=1 << 14):
+    """solve_both over NumPy matrices of up to batch_rows equal-length lines."""
+    import numpy as np
+    
+    totals = [0] * len(target_lengths)
+    batch = []
+    
+    def flush():
+        matrix = np.frombuffer(b''.join(batch), dtype=np.uint8).reshape(len(batch), -1) - ord('0')
+        for i, k in enumerate(target_lengths):
+            totals[i] += sum(max_subsequence_batch(matrix, k).tolist())
+        batch.clear()
+        
+    for line in input_data:
+        line = line.strip()
+        if not line:
+            continue
+        if isinstance(line, str):
+            line = line.encode()
+        if batch and (len(line) != len(batch[0]) or len(batch) >= batch_rows):
+            flush()
+        batch.append(line)
+    if batch:
+        flush()
+    return tuple(totals)
 
 def test_examples():
     examples_p1 = [
@@ -90,15 +138,14 @@ def test_examples():
         print(f"Part 2 Example Total FAIL: Expected {expected_p2_total}, got {p2_total}")
 
 if __name__ == "__main__":
-    input_path = 'inputs/day_03.txt'
+    input_path = get_input_path(3)
     
     test_examples()
     
-    if os.path.exists(input_path):
+    if input_path.exists():
         print("\n--- Solving Real Input ---")
-        p1 = solve_part1(input_path)
+        p1, p2 = solve_batched(iter_lines(3))
         print(f"Part 1 Total: {p1}")
-        p2 = solve_part2(input_path)
         print(f"Part 2 Total: {p2}")
     else:
         print(f"\n{input_path} not found, skipping real input.")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 import sys
 from utils.inputs import read_lines, read_text
+from utils.profiling import profiled
 
+@profiled
 def count_neighbors(r, c, grid, rows, cols):
     count = 0
     # 8 directions
@@ -18,6 +20,7 @@ def count_neighbors(r, c, grid, rows, cols):
                 count += 1
     return count
 
+@profiled
 def solve_part1(input_data):
     grid = [list(line.strip()) for line in input_data if line.strip()]
     if not grid:
@@ -38,7 +41,9 @@ def solve_part1(input_data):
                     
     return accessible_count
 
-def solve_part2(input_data):
+@profiled
+def solve_part2(input_data, round_sizes=None):
+    # Pass a list as round_sizes to get the number of rolls removed per round
     # Create a fresh grid for Part 2 simulation
     grid = [list(line.strip()) for line in input_data if line.strip()]
     if not grid:
@@ -65,11 +70,194 @@ def solve_part2(input_data):
             
         # Remove them
         total_removed += len(to_remove)
+        if round_sizes is not None:
+            round_sizes.append(len(to_remove))
         for r, c in to_remove:
             grid[r][c] = '.' # Mark as empty
             
     return total_removed
 
+# --- NumPy kernel backend ---
+# The grid becomes a uint8 array (1 = roll) and every cell's 8-neighbour count
+# comes from one separable 3x3 box sum, so Part 1 is a single masked compare.
+
+def load_grid(input_data):
+    import numpy as np
+    
+    rows = [line.strip() for line in input_data if line.strip()]
+    if not rows:
+        return np.zeros((0, 0), dtype=np.uint8)
+    flat = np.frombuffer(''.join(rows).encode(), dtype=np.uint8)
+    return (flat.reshape(len(rows), -1) == ord('@')).view(np.uint8)
+
+def neighbor_counts(grid):
+    """8-neighbour roll counts for every cell of a 0/1 uint8 grid (outside counts as empty)."""
+    # Row sums of 3 then column sums of 3 give the 3x3 box, minus the centre
+    horiz = grid.copy()
+    horiz[:, 1:] += grid[:, :-1]
+    horiz[:, :-1] += grid[:, 1:]
+    box = horiz.copy()
+    box[1:] += horiz[:-1]
+    box[:-1] += horiz[1:]
+    box -= grid
+    return box
+
+def count_accessible(grid):
+    return int(((neighbor_counts(grid) < 4) & (grid == 1)).sum())
+
+@profiled
+def count_accessible_banded(input_data, band_rows=4096):
+    """Part 1 over a streamed grid, holding only band_rows rows (+2 halo rows) at a time."""
+    import numpy as np
+    
+    total = 0
+    above = None
+    band = []
+    
+    def flush(below):
+        nonlocal above
+        rows = load_grid(band)
+        width = rows.shape[1]
+        halo_above = above if above is not None else np.zeros((1, width), dtype=np.uint8)
+        halo_below = load_grid([below]) if below is not None else np.zeros((1, width), dtype=np.uint8)
+        counts = neighbor_counts(np.vstack([halo_above, rows, halo_below]))[1:-1]
+        above = rows[-1:]
+        band.clear()
+        return int(((counts < 4) & (rows == 1)).sum())
+        
+    for line in input_data:
+        line = line.strip()
+        if not line:
+            continue
+        if len(band) == band_rows:
+            # The first row of the next band is this band's lower halo
+            total += flush(line)
+        band.append(line)
+    if band:
+        total += flush(None)
+    return total
+
+# --- Bitboard backend ---
+# Each row is a Python int with bit c set when column c holds a roll, so a cell
+# costs one bit. Neighbour counts come from bit-sliced adders over whole rows:
+# the 8 shifted neighbour rows are summed bitwise and only the "4 or more"
+# carry is kept, which answers every cell of a row in a few dozen big-int ops.
+
+_ROLL_BITS = str.maketrans('@.', '10')
+
+class Bitboard:
+    def __init__(self, rows, width):
+        self.rows = rows
+        self.width = width
+        self.mask = (1 << width) - 1
+        
+    @classmethod
+    def from_lines(cls, input_data):
+        lines = [line.strip() for line in input_data if line.strip()]
+        width = len(lines[0]) if lines else 0
+        # Reverse so column 0 ends up in bit 0
+        return cls([int(line[::-1].translate(_ROLL_BITS), 2) for line in lines], width)
+        
+    def crowded(self, r):
+        """Bits of row r whose cells have at least 4 neighbouring rolls."""
+        rows = self.rows
+        above = rows[r - 1] if r > 0 else 0
+        row = rows[r]
+        below = rows[r + 1] if r + 1 < len(rows) else 0
+        mask = self.mask
+        ones = twos = fours = 0
+        for x in (above, (above << 1) & mask, above >> 1,
+                  (row << 1) & mask, row >> 1,
+                  below, (below << 1) & mask, below >> 1):
+            # Counts only grow, so "reached 4" is the first carry out of the twos bit
+            carry = ones & x
+            ones ^= x
+            fours |= twos & carry
+            twos ^= carry
+        return fours
+        
+    def accessible(self, rows=None):
+        """{row: bits of rolls with fewer than 4 neighbours} for the given rows (default all)."""
+        if rows is None:
+            rows = range(len(self.rows))
+        found = {}
+        for r in rows:
+            bits = self.rows[r] & ~self.crowded(r)
+            if bits:
+                found[r] = bits
+        return found
+        
+    def count_accessible(self):
+        return sum(bits.bit_count() for bits in self.accessible().values())
+        
+    def peel(self):
+        """Removes accessible rolls round by round; returns the per-round removal sizes."""
+        round_sizes = []
+        found = self.accessible()
+        while found:
+            round_sizes.append(sum(bits.bit_count() for bits in found.values()))
+            for r, bits in found.items():
+                self.rows[r] &= ~bits
+            # A row can only gain accessible rolls if it or an adjacent row just lost some
+            dirty = {n for r in found for n in (r - 1, r, r + 1) if 0 <= n < len(self.rows)}
+            found = self.accessible(sorted(dirty))
+        return round_sizes
+
+@profiled
+def solve_part1_bits(input_data):
+    return Bitboard.from_lines(input_data).count_accessible()
+
+@profiled
+def solve_part2_bits(input_data):
+    return sum(Bitboard.from_lines(input_data).peel())
+
+# --- Worklist peeling engine (Part 2) ---
+# Like a k-core decomposition: keep live neighbour counts and only touch the
+# neighbours of rolls that were just removed, instead of rescanning the grid.
+
+@profiled
+def peel(grid):
+    """Removes accessible rolls round by round until none are left.
+    
+    Returns the number of rolls removed in each round, the same rounds
+    solve_part2 performs; their sum is the Part 2 answer.
+    """
+    import numpy as np
+    
+    rows, cols = grid.shape
+    # Pad by one so all 8 neighbour offsets stay in bounds for every real cell
+    width = cols + 2
+    alive = np.zeros((rows + 2, width), dtype=np.uint8)
+    alive[1:-1, 1:-1] = grid
+    counts = neighbor_counts(alive).astype(np.int16).ravel()
+    alive = alive.ravel()
+    offsets = np.array([-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1])
+    
+    # Every live roll outside the queue has >= 4 live neighbours, so after a
+    # round only neighbours of removed rolls can have crossed the threshold.
+    # Queued rolls are marked dead straight away, which also keeps a roll from
+    # being queued twice when several removed neighbours touch it.
+    queue = np.flatnonzero((alive == 1) & (counts < 4))
+    alive[queue] = 0
+    round_sizes = []
+    while len(queue):
+        round_sizes.append(len(queue))
+        # queue holds distinct cells, so each shifted index array is duplicate-free
+        for off in offsets:
+            counts[queue + off] -= 1
+        next_queue = []
+        for off in offsets:
+            touched = queue + off
+            crossed = touched[(alive[touched] == 1) & (counts[touched] < 4)]
+            alive[crossed] = 0
+            next_queue.append(crossed)
+        queue = np.concatenate(next_queue)
+    return round_sizes
+
+@profiled
+def solve_part2_worklist(input_data):
+    return sum(peel(load_grid(input_data)))
+
 if __name__ == "__main__":
     print("--- Day 4: Printing Department ---")
     
@@ -91,13 +279,26 @@ if __name__ == "__main__":
     p1_ex = solve_part1(example_input)
     print(f"Part 1 Example: {p1_ex} (Expected 13)")
     
-    p2_ex = solve_part2(example_input)
+    p1_ex_kernel = count_accessible(load_grid(example_input))
+    p1_ex_banded = count_accessible_banded(example_input, band_rows=3)
+    print(f"Part 1 Example (NumPy kernel / banded): {p1_ex_kernel} / {p1_ex_banded} (Expected 13)")
+    
+    p1_ex_bits = solve_part1_bits(example_input)
+    print(f"Part 1 Example (bitboard): {p1_ex_bits} (Expected 13)")
+    
+    p2_ex_rounds = []
+    p2_ex = solve_part2(example_input, p2_ex_rounds)
     print(f"Part 2 Example: {p2_ex} (Expected 43)")
     
-    if p1_ex == 13 and p2_ex == 43:
+    p2_ex_peel = peel(load_grid(example_input))
+    p2_ex_bits = Bitboard.from_lines(example_input).peel()
+    print(f"Part 2 Example rounds (rescan / worklist / bitboard): {p2_ex_rounds} / {p2_ex_peel} / {p2_ex_bits}")
+    
+    if (p1_ex == 13 and p1_ex_kernel == 13 and p1_ex_banded == 13 and p1_ex_bits == 13
+            and p2_ex == 43 and p2_ex_peel == p2_ex_rounds and p2_ex_bits == p2_ex_rounds):
         print("\n--- Solving Real Input ---")
         input_data = read_lines(4)
-        print(f"Part 1 Answer: {solve_part1(input_data)}")
-        print(f"Part 2 Answer: {solve_part2(input_data)}")
+        print(f"Part 1 Answer: {count_accessible(load_grid(input_data))}")
+        print(f"Part 2 Answer: {solve_part2_worklist(input_data)}")
     else:
         print("\nVerification FAILED. Stopping.")
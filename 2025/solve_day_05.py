@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 import sys
-from utils.inputs import read_lines, read_text
+from bisect import bisect_left, bisect_right
+from utils.parse_cache import load_parsed
+from utils.profiling import profiled
 
-def parse_input(input_data):
+@profiled
+def parse_input(input_data, fresh=None):
+    # Pass an IntervalSet as fresh to have each range added to it as it is
+    # read; it is then returned in place of the ranges list.
     ranges = []
     ids = []
     parsing_ranges = True
@@ -17,7 +22,10 @@ def parse_input(input_data):
         if parsing_ranges:
             try:
                 start, end = map(int, line.split('-'))
-                ranges.append((start, end))
+                if fresh is not None:
+                    fresh.add(start, end)
+                else:
+                    ranges.append((start, end))
             except ValueError:
                 continue
         else:
@@ -25,23 +33,18 @@ def parse_input(input_data):
                 ids.append(int(line))
             except ValueError:
                 continue
-    return ranges, ids
+    return (fresh if fresh is not None else ranges), ids
 
+@profiled
+def count_fresh_ids(ranges, ids):
+    return IntervalIndex(ranges).count_contained(ids)
+
+@profiled
 def solve_part1(input_data):
     ranges, ids = parse_input(input_data)
-    
-    fresh_count = 0
-    for ingredient_id in ids:
-        is_fresh = False
-        for start, end in ranges:
-            if start <= ingredient_id <= end:
-                is_fresh = True
-                break
-        if is_fresh:
-            fresh_count += 1
-            
-    return fresh_count
+    return count_fresh_ids(ranges, ids)
 
+@profiled
 def merge_intervals(intervals):
     if not intervals:
         return []
@@ -87,8 +90,79 @@ def merge_intervals(intervals):
             
     return merged
 
-def solve_part2(input_data):
-    ranges, _ = parse_input(input_data)
+# --- Interval sets ---
+# Merged ranges are disjoint and sorted, so the only range that can hold an ID
+# is the last one starting at or before it: one binary search per query.
+
+class IntervalSet:
+    """Mutable set of inclusive integer ranges, kept merged as sorted start/end lists."""
+    # Below this many IDs a bisect loop beats importing NumPy
+    BATCH_MIN = 4096
+    # Values the NumPy path can hold
+    INT64_MIN, INT64_END = -(1 << 63), 1 << 63
+    
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.covered = 0
+        self._arrays = None
+        
+    def add(self, start, end):
+        """Adds start-end, merging every range it overlaps or touches (same +1 rule as merge_intervals)."""
+        starts, ends = self.starts, self.ends
+        # Ranges [lo, hi) are the ones with end >= start - 1 and start <= end + 1
+        lo = bisect_left(ends, start - 1)
+        hi = bisect_right(starts, end + 1)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+            self.covered -= sum(ends[lo:hi]) - sum(starts[lo:hi]) + (hi - lo)
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
+        self.covered += end - start + 1
+        self._arrays = None
+        
+    def __len__(self):
+        return len(self.starts)
+        
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+        
+    def __contains__(self, value):
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+        
+    def contains_many(self, ids):
+        """Boolean NumPy array telling which of ids fall inside a range. Ranges and ids must fit in int64."""
+        import numpy as np
+        
+        if self._arrays is None:
+            self._arrays = (np.array(self.starts, dtype=np.int64), np.array(self.ends, dtype=np.int64))
+        starts, ends = self._arrays
+        ids = np.asarray(ids, dtype=np.int64)
+        idx = np.searchsorted(starts, ids, side='right') - 1
+        return (idx >= 0) & (ids <= ends[np.maximum(idx, 0)])
+        
+    def count_contained(self, ids):
+        lo, end = self.INT64_MIN, self.INT64_END
+        if len(ids) >= self.BATCH_MIN and self.starts and lo <= self.starts[0] and self.ends[-1] < end:
+            if not (lo <= min(ids) and max(ids) < end):
+                # Every range fits in int64, so IDs outside it can't be in any of them
+                ids = [value for value in ids if lo <= value < end]
+            return int(self.contains_many(ids).sum())
+        return sum(1 for value in ids if value in self)
+
+class IntervalIndex(IntervalSet):
+    """IntervalSet bulk-loaded from a list of ranges with one sort instead of per-range inserts."""
+    def __init__(self, ranges):
+        super().__init__()
+        merged = merge_intervals(list(ranges))
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+        self.covered = sum(end - start + 1 for start, end in merged)
+
+@profiled
+def count_fresh_total(ranges):
     merged_ranges = merge_intervals(ranges)
     
     total_count = 0
@@ -97,6 +171,11 @@ def solve_part2(input_data):
         
     return total_count
 
+@profiled
+def solve_part2(input_data):
+    ranges, _ = parse_input(input_data)
+    return count_fresh_total(ranges)
+
 if __name__ == "__main__":
     print("--- Day 5: Cafeteria ---")
     
@@ -122,10 +201,20 @@ if __name__ == "__main__":
     p2_ex = solve_part2(example_input)
     print(f"Part 2 Example: {p2_ex} (Expected 14)")
     
-    if p1_ex == 3 and p2_ex == 14:
+    # Same answers from ranges streamed into an IntervalSet while parsing
+    fresh, ex_ids = parse_input(example_input, IntervalSet())
+    p1_ex_stream = sum(1 for ingredient_id in ex_ids if ingredient_id in fresh)
+    print(f"Part 1/2 Example (streamed IntervalSet): {p1_ex_stream} / {fresh.covered} (Expected 3 / 14)")
+    
+    # Enough IDs for the NumPy path, one of them past int64
+    oversized_input = ["1-10", "20-30", ""] + ["5"] * 20000 + [str(2 ** 64)]
+    p1_ex_oversized = solve_part1(oversized_input)
+    print(f"Part 1 Example (ID past int64): {p1_ex_oversized} (Expected 20000)")
+    
+    if p1_ex == 3 and p2_ex == 14 and p1_ex_stream == 3 and fresh.covered == 14 and p1_ex_oversized == 20000:
         print("\n--- Solving Real Input ---")
-        input_data = read_lines(5)
-        print(f"Part 1 Answer: {solve_part1(input_data)}")
-        print(f"Part 2 Answer: {solve_part2(input_data)}")
+        ranges, ids = load_parsed(5, parse_input)
+        print(f"Part 1 Answer: {count_fresh_ids(ranges, ids)}")
+        print(f"Part 2 Answer: {count_fresh_total(ranges)}")
     else:
         print(f"Verification FAILED.")
@@ -1,145 +1,194 @@
 #!/usr/bin/env python3
 import sys
-from utils.inputs import read_lines, read_text
+import math
+from utils.inputs import iter_column_windows, read_lines, read_text
+from utils.profiling import profiled
 
-def get_problem_blocks(lines):
-    # Ensure all lines are equal length by padding with spaces
-    max_len = max(len(line) for line in lines)
-    padded_lines = [line.ljust(max_len) for line in lines]
+# --- Columnar NumPy parser ---
+# The sheet is loaded once into a (rows, width) uint8 array. Separator columns
+# are the all-space ones, every problem is a column slice (a view) of the
+# array, and numbers are digit-weighted sums instead of string concatenation.
+# Problems with a number too long for int64 are evaluated on Python ints.
+
+SPACE, PLUS, TIMES, ZERO = (ord(c) for c in ' +*0')
+# Widest number whose digit-weighted sum still fits in int64
+MAX_DIGITS = 18
+
+@profiled
+def load_sheet(input_data):
+    """The sheet as a 2D uint8 array, from a list of lines or the raw file bytes (e.g. read_view(6))."""
+    import numpy as np
     
-    # Identify empty columns (columns containing only spaces)
-    empty_cols = []
-    for c in range(max_len):
-        is_empty = True
-        for line in padded_lines:
-            if line[c] != ' ':
-                is_empty = False
-                break
-        if is_empty:
-            empty_cols.append(c)
-            
-    # Group ranges of non-empty columns
-    problem_ranges = []
-    start = 0
-    # Add a sentinel empty column at the end to close the last range
-    boundaries = empty_cols + [max_len]
+    if isinstance(input_data, (bytes, bytearray, memoryview)):
+        flat = np.frombuffer(input_data, dtype=np.uint8)
+        newlines = np.flatnonzero(flat == ord('\n'))
+        if len(newlines) and newlines[-1] == len(flat) - 1:
+            stride = newlines[0] + 1
+            if len(flat) % stride == 0 and (newlines == np.arange(stride - 1, len(flat), stride)).all():
+                # Equal-length rows: the file itself is the array, minus the newline column
+                return flat.reshape(-1, stride)[:, :-1]
+        input_data = bytes(input_data).decode().splitlines()
+        
+    lines = [line.rstrip('\n') for line in input_data if line.strip('\n')]
+    width = max((len(line) for line in lines), default=0)
+    flat = np.frombuffer(''.join(line.ljust(width) for line in lines).encode(), dtype=np.uint8)
+    return flat.reshape(len(lines), width)
+
+def block_bounds(sheet):
+    """(starts, ends) column arrays of the problems, ends exclusive."""
+    import numpy as np
     
-    current_start = 0
-    unique_boundaries = sorted(list(set(boundaries)))
+    blank = (sheet == SPACE).all(axis=0)
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], blank, [1])).astype(np.int8)))
+    return edges[0::2], edges[1::2]
+
+def problem_blocks(sheet, which=None):
+    """Each problem (or only those flagged in the boolean array which) as a (rows, block width) view into sheet."""
+    starts, ends = block_bounds(sheet)
+    if which is not None:
+        starts, ends = starts[which], ends[which]
+    return [sheet[:, lo:hi] for lo, hi in zip(starts.tolist(), ends.tolist())]
+
+def block_columns(values, starts, width):
+    """Spreads one value per block (last axis) over the block's columns and the separators after it."""
+    import numpy as np
     
-    blocks = []
-    for boundary in unique_boundaries:
-        if boundary > current_start:
-            # We found a block from current_start to boundary
-            # Extract block
-            block_lines = [line[current_start:boundary] for line in padded_lines]
-            blocks.append(block_lines)
-        current_start = boundary + 1
-    return blocks
+    # Columns per block, counting leading blanks into the first one
+    spans = np.diff(starts, append=width)
+    spans[0] += starts[0]
+    return np.repeat(values, spans, axis=-1)
 
-def solve_part1(input_data):
-    lines = [line.replace('\n', '') for line in input_data if line.strip('\n')]
-    if not lines:
+def solve_block(block, by_columns):
+    """One problem on Python ints, for numbers too long for the int64 kernels."""
+    lines = block[:-1].T if by_columns else block[:-1]
+    numbers = [int(bytes(line).replace(b' ', b'')) for line in lines if (line != SPACE).any()]
+    if not numbers:
         return 0
-        
-    blocks = get_problem_blocks(lines)
-    total_result = 0
+    return sum(numbers) if block[-1].max() == PLUS else math.prod(numbers)
+
+def digits_after(is_digit, axis):
+    """For every cell, how many digit cells follow it along axis."""
+    import numpy as np
     
-    for block_lines in blocks:
-        operator = None
-        operator_row_idx = -1
-        
-        # Find operator (search from bottom up)
-        for r in range(len(block_lines) - 1, -1, -1):
-            row_content = block_lines[r].strip()
-            if not row_content:
-                continue
-            if row_content in ['+', '*']:
-                operator = row_content
-                operator_row_idx = r
-                break
-        
-        if operator:
-            vals = []
-            # Parse horizontal numbers above operator
-            for nr in range(operator_row_idx):
-                num_str = block_lines[nr].strip()
-                if num_str:
-                    try:
-                        vals.append(int(num_str))
-                    except ValueError:
-                        pass
-            
-            if vals:
-                res = vals[0]
-                for v in vals[1:]:
-                    if operator == '+':
-                        res += v
-                    elif operator == '*':
-                        res *= v
-                total_result += res
-                
-    return total_result
+    return np.flip(np.cumsum(np.flip(is_digit, axis), axis=axis), axis) - is_digit
 
-def solve_part2(input_data):
-    lines = [line.replace('\n', '') for line in input_data if line.strip('\n')]
-    if not lines:
+def digit_weighted(digits, is_digit, exponent):
+    """digit * 10**exponent for digit cells, 0 elsewhere."""
+    import numpy as np
+    
+    powers = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+    return np.where(is_digit, (digits.astype(np.int64) - ZERO) * powers[exponent], 0)
+
+def combine(values, present, ops):
+    """Sums the + problems and multiplies the * ones; values/present are (numbers, problems)."""
+    import numpy as np
+    
+    plus = np.where(present, values, 0)
+    times = np.where(present, values, 1)
+    largest = int(values.max(initial=0)) + 1
+    if largest ** len(values) >= 1 << 63:
+        # A single product could overflow int64: reduce on Python ints
+        plus, times = plus.astype(object), times.astype(object)
+    plus, times = plus.sum(axis=0), times.prod(axis=0)
+    valid = present.any(axis=0)
+    # The grand total can still outgrow int64, so add it up in Python
+    return sum(plus[(ops == PLUS) & valid].tolist()) + sum(times[(ops == TIMES) & valid].tolist())
+
+@profiled
+def sum_row_problems(sheet):
+    """Part 1: every row above the operator holds one number of the problem."""
+    import numpy as np
+    
+    if sheet.size == 0:
         return 0
-        
-    blocks = get_problem_blocks(lines)
-    total_result = 0
+    starts, ends = block_bounds(sheet)
+    if len(starts) == 0:
+        return 0
+    digits = sheet[:-1]
+    is_digit = digits != SPACE
+    # Blocks holding a number longer than MAX_DIGITS drop out of the kernel
+    long = (np.add.reduceat(is_digit, starts, axis=1, dtype=np.int64) > MAX_DIGITS).any(axis=0)
+    if long.any():
+        is_digit &= ~block_columns(long, starts, sheet.shape[1])
+    # Digits after a cell are counted to the end of the whole row, so rebase
+    # them on the last column of the cell's block (clipped for separators)
+    after = digits_after(is_digit, axis=1)
+    exponent = np.maximum(after - block_columns(after[:, ends - 1], starts, sheet.shape[1]), 0)
+    values = np.add.reduceat(digit_weighted(digits, is_digit, exponent), starts, axis=1)
+    present = np.logical_or.reduceat(is_digit, starts, axis=1)
+    ops = np.maximum.reduceat(sheet[-1], starts)
+    total = combine(values, present, ops)
+    if long.any():
+        total += sum(solve_block(block, False) for block in problem_blocks(sheet, long))
+    return total
+
+@profiled
+def sum_column_problems(sheet):
+    """Part 2: every column of a problem holds one number, read top to bottom."""
+    import numpy as np
     
-    for block_lines in blocks:
-        operator = None
-        operator_row_idx = -1
-        
-        # Find operator (search from bottom up)
-        for r in range(len(block_lines) - 1, -1, -1):
-            row_content = block_lines[r].strip()
-            if not row_content:
-                continue
-            if row_content in ['+', '*']:
-                operator = row_content
-                operator_row_idx = r
-                break
-        
-        if operator:
-            vals = []
-            # Parse vertical numbers above operator
-            # Iterate columns
-            width = len(block_lines[0])
-            for c in range(width):
-                col_str = ""
-                for r in range(operator_row_idx):
-                    char = block_lines[r][c]
-                    if char != ' ':
-                        col_str += char
-                
-                if col_str:
-                    try:
-                        vals.append(int(col_str))
-                    except ValueError:
-                        pass
-            
-            if vals:
-                # Part 2 says "Reading the problems right-to-left one column at a time"
-                # This affects the order of operations?
-                # "The rightmost problem is 4 + 431 + 623 = 1058"
-                # Addition is commutative, so order doesn't matter for +
-                # Assume multiplication is also commutative/associative for these problems (all * or all +)?
-                # "each problem has a group of numbers that need to be either added (+) or multiplied (*) together."
-                # This implies a single operation type per problem. So order doesn't matter for * either.
-                # Just collect all numbers and apply op.
-                
-                res = vals[0]
-                for v in vals[1:]:
-                    if operator == '+':
-                        res += v
-                    elif operator == '*':
-                        res *= v
-                total_result += res
-                
-    return total_result
+    if sheet.size == 0:
+        return 0
+    starts, ends = block_bounds(sheet)
+    if len(starts) == 0:
+        return 0
+    digits = sheet[:-1]
+    is_digit = digits != SPACE
+    # Blocks holding a number longer than MAX_DIGITS drop out of the kernel
+    long = np.logical_or.reduceat(is_digit.sum(axis=0) > MAX_DIGITS, starts)
+    if long.any():
+        is_digit &= ~block_columns(long, starts, sheet.shape[1])
+    column_values = digit_weighted(digits, is_digit, digits_after(is_digit, axis=0)).sum(axis=0)
+    column_present = is_digit.any(axis=0)
+    
+    # Gather the columns into a (max block width, problems) grid, padding with absent numbers
+    idx = starts + np.arange((ends - starts).max())[:, None]
+    inside = idx < ends
+    idx = np.minimum(idx, sheet.shape[1] - 1)
+    ops = np.maximum.reduceat(sheet[-1], starts)
+    total = combine(column_values[idx], column_present[idx] & inside, ops)
+    if long.any():
+        total += sum(solve_block(block, True) for block in problem_blocks(sheet, long))
+    return total
+
+# --- Streaming evaluation ---
+# A problem is finished as soon as a full-height blank column follows it, so
+# the sheet can be read a window of columns at a time. Only the problem still
+# open at the right edge of a window is carried into the next one, which
+# bounds memory by the window plus the widest single problem.
+
+@profiled
+def solve_streaming(windows):
+    """(Part 1, Part 2) totals from an iterable of column windows (see iter_column_windows)."""
+    import numpy as np
+    
+    part1 = part2 = 0
+    carry = None
+    for window in windows:
+        sheet = np.frombuffer(b''.join(window), dtype=np.uint8).reshape(len(window), -1)
+        if carry is not None:
+            sheet = np.hstack([carry, sheet])
+        blank = np.flatnonzero((sheet == SPACE).all(axis=0))
+        if len(blank):
+            # Everything left of the last blank column is a run of complete problems
+            closed = sheet[:, :blank[-1]]
+            part1 += sum_row_problems(closed)
+            part2 += sum_column_problems(closed)
+            sheet = sheet[:, blank[-1] + 1:]
+        # Copy so the carried problem doesn't pin the whole window
+        carry = sheet.copy()
+    if carry is not None:
+        part1 += sum_row_problems(carry)
+        part2 += sum_column_problems(carry)
+    return part1, part2
+
+@profiled
+def solve_part1(input_data):
+    return sum_row_problems(load_sheet(input_data))
+
+@profiled
+def solve_part2(input_data):
+    return sum_column_problems(load_sheet(input_data))
 
 if __name__ == "__main__":
     print("--- Day 6: Trash Compactor ---")
@@ -159,10 +208,16 @@ if __name__ == "__main__":
     p2_ex = solve_part2(example_input)
     print(f"Part 2 Example: {p2_ex} (Expected 3263827)")
     
-    if p1_ex == 4277556 and p2_ex == 3263827:
+    # Windows narrower than a problem, so problems straddle window edges
+    p_ex_stream = solve_streaming(
+        [line[c:c + 2].ljust(2).encode() for line in example_input] for c in range(0, len(example_input[0]), 2)
+    )
+    print(f"Parts 1/2 Example (streamed): {p_ex_stream} (Expected (4277556, 3263827))")
+    
+    if p1_ex == 4277556 and p2_ex == 3263827 and p_ex_stream == (4277556, 3263827):
         print("\n--- Solving Real Input ---")
-        input_data = read_lines(6)
-        print(f"Part 1 Answer: {solve_part1(input_data)}")
-        print(f"Part 2 Answer: {solve_part2(input_data)}")
+        part1, part2 = solve_streaming(iter_column_windows(6))
+        print(f"Part 1 Answer: {part1}")
+        print(f"Part 2 Answer: {part2}")
     else:
         print(f"Verification FAILED.")
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import sys
+import collections
 from utils.inputs import read_lines, read_text
+from utils.parse_cache import load_parsed
+from utils.profiling import profiled
 
+@profiled
 def solve_part1(input_data):
     grid = [line.strip() for line in input_data if line.strip()]
     if not grid:
@@ -51,6 +55,7 @@ def solve_part1(input_data):
         
     return total_splits
 
+@profiled
 def solve_part2(input_data):
     grid = [line.strip() for line in input_data if line.strip()]
     if not grid:
@@ -114,6 +119,207 @@ def solve_part2(input_data):
     
     return completed_timelines
 
+# --- Dense-row beam engine ---
+# Each row of the manifold is a boolean splitter mask and the timelines are an
+# array of per-column counts, so one row step is a handful of vectorized ops:
+# counts pass straight through where there is no splitter and are shifted one
+# column left and right where there is.
+
+# Counts at most triple per row step (pass-through plus both neighbours), so
+# int64 is safe while every count stays below this
+SAFE_INT64 = (1 << 63) // 3
+
+def load_manifold(input_data):
+    """(splitter mask as a 2D bool array, start row, start column); start is (-1, -1) without an S."""
+    import numpy as np
+    
+    lines = [line.strip() for line in input_data if line.strip()]
+    width = max((len(line) for line in lines), default=0)
+    grid = np.frombuffer(''.join(line.ljust(width, '.') for line in lines).encode(), dtype=np.uint8)
+    grid = grid.reshape(len(lines), width)
+    start = np.flatnonzero(grid == ord('S'))
+    if len(start) == 0:
+        return grid == ord('^'), -1, -1
+    return grid == ord('^'), *divmod(int(start[0]), width)
+
+@profiled
+def propagate(splitters, start_row, start_col):
+    """(Part 1 splitters hit, Part 2 timelines) for a beam entering below (start_row, start_col)."""
+    if start_row < 0:
+        return 0, 0
+    return beam_counts(splitters[start_row + 1:], splitters.shape[1], start_col)
+
+def beam_counts(masks, cols, start_col):
+    """(splitters hit, timelines) for a beam entering at start_col above an iterable of splitter rows."""
+    import numpy as np
+    
+    # One spare column on each side catches the beams that leave the grid
+    counts = np.zeros(cols + 2, dtype=np.int64)
+    counts[start_col + 1] = 1
+    splits = 0
+    exited = 0
+    for mask in masks:
+        if counts.dtype != object and counts.max() >= SAFE_INT64:
+            # From here on counts could overflow: switch to Python ints
+            counts = counts.astype(object)
+        # Only the splitter columns need work; everything else passes through.
+        # Splitters are distinct, so neither shifted index array repeats a column.
+        idx = np.flatnonzero(mask) + 1
+        hit = counts[idx]
+        splits += int(np.count_nonzero(hit))
+        counts[idx] = 0
+        counts[idx - 1] += hit
+        counts[idx + 1] += hit
+        exited += int(counts[0]) + int(counts[-1])
+        counts[0] = counts[-1] = 0
+    # Summed as Python ints, the total can be past int64 even when no count is
+    return splits, exited + sum(counts.tolist())
+
+# --- Exit table for many start positions ---
+# Propagating backwards from the bottom row gives, for every cell, the number
+# of timelines for a beam that is at that cell heading down, so any start
+# position is a lookup. Rows whose counts fit in int64 are all kept; above
+# that only every CHECKPOINT_ROWS-th row of Python ints is, and a row in
+# between is rebuilt from the checkpoint below it. The Part 1 split count
+# can't be added up cell by cell (beams merge), so it is not tabulated: a
+# split query is a forward pass over the rows below the cell, O(rows x cols)
+# rather than O(1), batched per row and memoized by ExitTable. The table
+# depends only on the manifold, so it is cached next to the input with
+# load_parsed.
+
+CHECKPOINT_ROWS = 256
+
+def step_up(below, idx):
+    """Padded timelines of a row from those of the row below, whose splitters sit at padded columns idx."""
+    if below.dtype != object and below.max() >= SAFE_INT64:
+        below = below.astype(object)
+    row = below.copy()
+    row[idx] = below[idx - 1] + below[idx + 1]
+    # A beam leaving the grid is one finished timeline
+    row[0] = row[-1] = 1
+    return row
+
+def splitter_row(packed, row, cols):
+    """Row of the bit-packed splitter mask as a bool array."""
+    import numpy as np
+    
+    return np.unpackbits(packed[row], count=cols).view(bool)
+
+@profiled
+def exit_table(input_data):
+    """(timelines, packed splitters, start) for the manifold in input_data.
+    
+    timelines[r] holds the Part 2 answer of a beam at (r, c) heading down for
+    every column c, or None between checkpoints (see ExitTable). The
+    splitter mask is kept bit-packed for the on-demand split counts; start is
+    the S position.
+    """
+    import numpy as np
+    
+    splitters, start_row, start_col = load_manifold(input_data)
+    rows, cols = splitters.shape
+    timelines = [None] * rows
+    below = np.ones(cols + 2, dtype=np.int64)
+    for r in range(rows - 1, -1, -1):
+        if r < rows - 1:
+            below = step_up(below, np.flatnonzero(splitters[r + 1]) + 1)
+        if below.dtype != object or r % CHECKPOINT_ROWS == 0:
+            timelines[r] = below[1:-1]
+    return timelines, np.packbits(splitters, axis=1), (start_row, start_col)
+
+class ExitTable:
+    """Queries over an exit_table result, memoizing rebuilt rows and split counts.
+    
+    Timelines of a kept row are an O(1) lookup; any other row costs up to
+    CHECKPOINT_ROWS row steps once, then is served from an LRU of ROW_CACHE
+    rows. Split counts are not a lookup: each queried row costs one forward
+    pass over the rows below it, O(rows x splitters per row) for all the
+    columns asked for at once (see query_many), memoized per (row, col).
+    """
+    ROW_CACHE = 64
+    # Cells of the (columns x starts) reach matrix in one batched forward pass
+    BATCH_CELLS = 1 << 24
+    
+    def __init__(self, timelines, packed, start):
+        self.timelines = timelines
+        self.packed = packed
+        self.start = start
+        self.cols = len(timelines[-1]) if timelines else 0
+        self._rows = collections.OrderedDict()
+        self._splits = {}
+        
+    def timelines_row(self, row):
+        """Timelines for a beam at (row, c) heading down, for every column c."""
+        import numpy as np
+        
+        if self.timelines[row] is not None:
+            return self.timelines[row]
+        if row in self._rows:
+            self._rows.move_to_end(row)
+            return self._rows[row]
+        # Step up from the nearest row below that is kept or memoized
+        below = row + 1
+        while self.timelines[below] is None and below not in self._rows:
+            below += 1
+        known = self.timelines[below] if self.timelines[below] is not None else self._rows[below]
+        padded = np.concatenate(([1], known, [1]))
+        for r in range(below - 1, row - 1, -1):
+            padded = step_up(padded, np.flatnonzero(splitter_row(self.packed, r + 1, self.cols)) + 1)
+        self._rows[row] = padded[1:-1]
+        if len(self._rows) > self.ROW_CACHE:
+            self._rows.popitem(last=False)
+        return self._rows[row]
+        
+    def split_counts(self, row, cols):
+        """Splitters reached by beams at (row, c) heading down, for each c in cols, in one forward pass."""
+        import numpy as np
+        
+        cols = np.asarray(cols, dtype=np.int64)
+        counts = np.zeros(len(cols), dtype=np.int64)
+        # reach[c, k]: whether start k has a beam in padded column c. Rows are
+        # columns so the splitter gathers below read contiguous memory.
+        chunk = max(1, self.BATCH_CELLS // (self.cols + 2))
+        for lo in range(0, len(cols), chunk):
+            part = cols[lo:lo + chunk]
+            reach = np.zeros((self.cols + 2, len(part)), dtype=bool)
+            reach[part + 1, np.arange(len(part))] = True
+            splits = counts[lo:lo + chunk]
+            for r in range(row + 1, len(self.packed)):
+                idx = np.flatnonzero(splitter_row(self.packed, r, self.cols)) + 1
+                if not len(idx):
+                    continue
+                hit = reach[idx]
+                splits += np.count_nonzero(hit, axis=0)
+                reach[idx] = False
+                reach[idx - 1] |= hit
+                reach[idx + 1] |= hit
+        return counts
+        
+    def query_many(self, starts):
+        """[(splitters reached, timelines)] for beams at each (row, col) of starts heading down.
+        
+        Starts are grouped by row, so all the columns asked for in one row
+        share a single forward pass.
+        """
+        starts = [(int(row), int(col)) for row, col in starts]
+        by_row = collections.defaultdict(set)
+        for row, col in starts:
+            if (row, col) not in self._splits:
+                by_row[row].add(col)
+        for row, cols in by_row.items():
+            cols = sorted(cols)
+            for col, count in zip(cols, self.split_counts(row, cols).tolist()):
+                self._splits[row, col] = count
+        return [(self._splits[row, col], int(self.timelines_row(row)[col])) for row, col in starts]
+        
+    def query(self, row, col):
+        """(splitters reached, timelines) for a beam at (row, col) heading down."""
+        return self.query_many([(row, col)])[0]
+
+def load_exit_table():
+    """Exit table of the real input, rebuilt only when the input changes."""
+    return ExitTable(*load_parsed(7, exit_table, version=2))
+
 if __name__ == "__main__":
     print("--- Day 7: Laboratories ---")
     
@@ -144,10 +350,31 @@ if __name__ == "__main__":
     p2_ex = solve_part2(example_input)
     print(f"Part 2 Example: {p2_ex} (Expected 40)")
     
-    if p1_ex == 21 and p2_ex == 40:
+    p_ex_dense = propagate(*load_manifold(example_input))
+    print(f"Parts 1/2 Example (dense rows): {p_ex_dense} (Expected (21, 40))")
+    
+    ex_table = ExitTable(*exit_table(example_input))
+    p_ex_table = ex_table.query(*ex_table.start)
+    print(f"Parts 1/2 Example (exit table): {p_ex_table} (Expected (21, 40))")
+    
+    # Every cell at once through query_many, against one forward pass per cell
+    ex_splitters = load_manifold(example_input)[0]
+    ex_cells = [(r, c) for r in range(ex_splitters.shape[0]) for c in range(ex_splitters.shape[1])]
+    ex_batched_ok = ex_table.query_many(ex_cells) == [propagate(ex_splitters, r, c) for r, c in ex_cells]
+    print(f"Exit table query_many matches every cell: {ex_batched_ok}")
+    
+    if p1_ex == 21 and p2_ex == 40 and p_ex_dense == (21, 40) and p_ex_table == (21, 40) and ex_batched_ok:
         print("\n--- Solving Real Input ---")
-        input_data = read_lines(7)
-        print(f"Part 1 Answer: {solve_part1(input_data)}")
-        print(f"Part 2 Answer: {solve_part2(input_data)}")
+        part1, part2 = propagate(*load_manifold(read_lines(7)))
+        print(f"Part 1 Answer: {part1}")
+        print(f"Part 2 Answer: {part2}")
+        
+        table = load_exit_table()
+        start_row, start_col = table.start
+        if table.query(start_row, start_col) != (part1, part2):
+            print("Exit table disagrees with the forward pass!")
+        start_answers = table.query_many((start_row, c) for c in range(table.cols))
+        best = max(range(table.cols), key=lambda c: start_answers[c][1])
+        print(f"Most timelines from the start row: column {best}, {start_answers[best][1]}")
     else:
         print(f"Verification FAILED. Stopping.")
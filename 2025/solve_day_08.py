@@ -1,33 +1,11 @@
 #!/usr/bin/env python3
 import sys
 import math
-from utils.inputs import read_lines, read_text
-
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.size = [1] * n
-        self.num_sets = n
-        
-    def find(self, i):
-        if self.parent[i] == i:
-            return i
-        self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
-        
-    def union(self, i, j):
-        root_i = self.find(i)
-        root_j = self.find(j)
-        
-        if root_i != root_j:
-            if self.size[root_i] < self.size[root_j]:
-                root_i, root_j = root_j, root_i
-            self.parent[root_j] = root_i
-            self.size[root_i] += self.size[root_j]
-            self.num_sets -= 1
-            return True
-        return False
+from utils.parse_cache import load_parsed
+from utils.profiling import profiled
+from utils.union_find import UnionFind
 
+@profiled
 def parse_input(input_data):
     coords = []
     for line in input_data:
@@ -41,79 +19,228 @@ def parse_input(input_data):
             continue
     return coords
 
-def solve_part1(input_data, limit):
-    coords = parse_input(input_data)
+def parse_points(input_data):
+    """Coordinates as an (n, 3) int64 array."""
+    import numpy as np
+    
+    return np.array(parse_input(input_data), dtype=np.int64).reshape(-1, 3)
+
+# --- Candidate edges from a k-d tree ---
+# Instead of materializing all n(n-1)/2 pairs, ask a k-d tree for the pairs
+# within a radius, emit the ones not emitted yet in sorted order, and double
+# the radius only when the caller wants more. Memory follows the number of
+# pairs inside the final radius, about n*k for the short edges the puzzle uses.
+
+@profiled
+def candidate_edges(coords, k=8):
+    """Yields (dist_sq, i, j) with i < j in the order of sorting all pairs by distance.
+    
+    Ties come out by (i, j), like the stable sort over the i/j double loop. The
+    first radius reaches about the k-th nearest neighbour of a typical point.
+    """
+    # Deferred: scipy.spatial is only needed once edges are requested
+    import numpy as np
+    from scipy.spatial import cKDTree
+    
     n = len(coords)
-    edges = []
-    
-    # Calculate all pairwise distances
-    for i in range(n):
-        for j in range(i + 1, n):
-            p1 = coords[i]
-            p2 = coords[j]
-            dist_sq = (p1[0]-p2[0])**2 + (p1[1]-p2[1])**2 + (p1[2]-p2[2])**2
-            edges.append((dist_sq, i, j))
-            
-    # Sort edges by distance (ascending)
-    edges.sort(key=lambda x: x[0])
+    if n < 2:
+        return
+    points = np.asarray(coords, dtype=np.int64)
+    tree = cKDTree(points)
+    kth, _ = tree.query(points, k=min(k, n - 1) + 1)
+    radius_sq = max(1, int(np.ceil(np.median(kth[:, -1]) ** 2)))
+    # No pair is further apart than the bounding box diagonal
+    span = points.max(axis=0) - points.min(axis=0)
+    max_sq = int((span ** 2).sum())
+    
+    done_sq = -1
+    while done_sq < max_sq:
+        # Pad the float radius; the exact integer test below decides
+        pairs = tree.query_pairs(np.sqrt(radius_sq) * (1 + 1e-9) + 1e-6, output_type='ndarray')
+        i, j = pairs[:, 0], pairs[:, 1]
+        dist_sq = ((points[i] - points[j]) ** 2).sum(axis=1)
+        band = (dist_sq > done_sq) & (dist_sq <= radius_sq)
+        i, j, dist_sq = i[band], j[band], dist_sq[band]
+        order = np.lexsort((j, i, dist_sq))
+        yield from zip(dist_sq[order].tolist(), i[order].tolist(), j[order].tolist())
+        done_sq = radius_sq
+        radius_sq *= 4
+
+# --- Blocked distance kernel (Part 1) ---
+# Part 1 only needs the `limit` shortest edges. Squared distances are computed
+# one tile of the upper triangle at a time and only entries that can still be
+# among the best `limit` are kept, so memory is O(tile + limit).
+
+@profiled
+def shortest_edges(points, limit, tile_rows=256, tile_cols=4096):
+    """(dist_sq, i, j) arrays of the `limit` shortest pairs i < j, ordered by (dist_sq, i, j)."""
+    import numpy as np
     
+    empty = np.zeros(0, dtype=np.int64)
+    if limit <= 0:
+        return empty, empty, empty
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    n = len(points)
+    kept_d, kept_i, kept_j = [], [], []
+    kept = 0
+    # Distance of the limit-th best pair so far; anything longer can be skipped
+    bound = np.iinfo(np.int64).max
+    for a in range(0, n, tile_rows):
+        rows = points[a:a + tile_rows]
+        row_idx = np.arange(a, a + len(rows))
+        for b in range(a + 1, n, tile_cols):
+            cols = points[b:b + tile_cols]
+            dist_sq = np.zeros((len(rows), len(cols)), dtype=np.int64)
+            for axis in range(3):
+                diff = rows[:, axis, None] - cols[None, :, axis]
+                dist_sq += diff * diff
+            # Upper triangle only, and only what can still make the cut
+            col_idx = np.arange(b, b + len(cols))
+            candidates = dist_sq <= bound
+            if b <= row_idx[-1]:
+                candidates &= col_idx > row_idx[:, None]
+            r, c = np.nonzero(candidates)
+            if not len(r):
+                continue
+            kept_d.append(dist_sq[r, c])
+            kept_i.append(row_idx[r])
+            kept_j.append(col_idx[c])
+            kept += len(r)
+            if kept >= 2 * limit:
+                # Shrink to the best `limit` (plus anything tied with the last one)
+                d = np.concatenate(kept_d)
+                bound = np.partition(d, limit - 1)[limit - 1]
+                keep = d <= bound
+                kept_d = [d[keep]]
+                kept_i = [np.concatenate(kept_i)[keep]]
+                kept_j = [np.concatenate(kept_j)[keep]]
+                kept = len(kept_d[0])
+    if not kept:
+        return empty, empty, empty
+    d, i, j = np.concatenate(kept_d), np.concatenate(kept_i), np.concatenate(kept_j)
+    order = np.lexsort((j, i, d))[:limit]
+    return d[order], i[order], j[order]
+
+@profiled
+def multiply_largest_circuits(coords, limit):
+    n = len(coords)
     uf = UnionFind(n)
     
     # Process top `limit` edges
-    count_limit = min(limit, len(edges))
-    
-    for k in range(count_limit):
-        _, i, j = edges[k]
-        uf.union(i, j)
+    _, edge_i, edge_j = shortest_edges(coords, limit)
+    uf.union_many(edge_i, edge_j)
         
-    # Get all component sizes
-    component_sizes = []
-    seen_roots = set()
-    for i in range(n):
-        root = uf.find(i)
-        if root not in seen_roots:
-            component_sizes.append(uf.size[root])
-            seen_roots.add(root)
-            
-    component_sizes.sort(reverse=True)
-    
-    if len(component_sizes) < 3:
-        result = 1
-        for s in component_sizes:
-            result *= s
-        return result
-    
-    return component_sizes[0] * component_sizes[1] * component_sizes[2]
+    # Product of the (up to) three largest component sizes
+    return math.prod(sorted(uf.component_sizes().tolist(), reverse=True)[:3])
 
-def solve_part2(input_data):
-    coords = parse_input(input_data)
+@profiled
+def solve_part1(input_data, limit):
+    return multiply_largest_circuits(parse_input(input_data), limit)
+
+@profiled
+def last_connection_product(coords):
     n = len(coords)
-    edges = []
-    
-    # Calculate all pairwise distances
-    for i in range(n):
-        for j in range(i + 1, n):
-            p1 = coords[i]
-            p2 = coords[j]
-            dist_sq = (p1[0]-p2[0])**2 + (p1[1]-p2[1])**2 + (p1[2]-p2[2])**2
-            edges.append((dist_sq, i, j))
-            
-    # Sort edges by distance (ascending)
-    edges.sort(key=lambda x: x[0])
-    
     uf = UnionFind(n)
     
-    # Connect until fully connected
-    for _, i, j in edges:
+    # Connect until fully connected; the radius only grows until that happens
+    for _, i, j in candidate_edges(coords):
         if uf.union(i, j):
             if uf.num_sets == 1:
                 # This was the last edge needed
                 p1 = coords[i]
                 p2 = coords[j]
-                return p1[0] * p2[0]
+                return int(p1[0]) * int(p2[0])
                 
     return 0
 
+# --- Dense Prim mode (Part 2) ---
+# Kruskal stops at the heaviest edge of the minimum spanning tree, so Part 2
+# only needs that tree. Prim grows it with one "best distance to the tree"
+# vector and one distance row per added box: O(n^2) time, O(n) memory.
+
+@profiled
+def prim_mst(points):
+    """(dist_sq, i, j) arrays of the n-1 minimum spanning tree edges, in the order Prim adds them."""
+    import numpy as np
+    
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    n = len(points)
+    tree_d = np.zeros(max(n - 1, 0), dtype=np.int64)
+    tree_i = np.zeros_like(tree_d)
+    tree_j = np.zeros_like(tree_d)
+    if n < 2:
+        return tree_d, tree_i, tree_j
+    
+    # Boxes not in the tree yet, packed at the front of these arrays; an added
+    # box is swapped with the last one so every step works on a shrinking prefix
+    rest = np.arange(1, n)
+    xs, ys, zs = (points[1:, axis].copy() for axis in range(3))
+    best = np.full(n - 1, np.iinfo(np.int64).max, dtype=np.int64)
+    link = np.zeros(n - 1, dtype=np.int64)
+    dist_sq = np.empty(n - 1, dtype=np.int64)
+    diff = np.empty(n - 1, dtype=np.int64)
+    
+    v = 0
+    for step in range(n - 1):
+        m = n - 1 - step
+        d, t = dist_sq[:m], diff[:m]
+        np.subtract(xs[:m], points[v, 0], out=d)
+        d *= d
+        for axis, column in ((1, ys), (2, zs)):
+            np.subtract(column[:m], points[v, axis], out=t)
+            t *= t
+            d += t
+        closer = d < best[:m]
+        best[:m][closer] = d[closer]
+        link[:m][closer] = v
+        
+        k = int(np.argmin(best[:m]))
+        v = int(rest[k])
+        tree_d[step] = best[k]
+        tree_i[step], tree_j[step] = sorted((int(link[k]), v))
+        last = m - 1
+        for column in (rest, xs, ys, zs, best, link):
+            column[k] = column[last]
+    return tree_d, tree_i, tree_j
+
+@profiled
+def last_connection_product_prim(points):
+    """Same answer as last_connection_product, from the spanning tree instead of a sorted edge list."""
+    import numpy as np
+    
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    n = len(points)
+    if n < 2:
+        return 0
+    tree_d, tree_i, tree_j = prim_mst(points)
+    heaviest = tree_d.max()
+    
+    # Prim may pick a different edge among several of the heaviest length, so
+    # replay Kruskal exactly from there: the tree edges below it give the same
+    # components, then every pair at exactly that length joining two of them,
+    # in (i, j) order.
+    uf = UnionFind(n)
+    lighter = tree_d < heaviest
+    uf.union_many(tree_i[lighter], tree_j[lighter])
+    labels = uf.roots()
+    # Every joining pair has an end outside the largest component
+    largest = np.bincount(labels).argmax()
+    tied = set()
+    for i in np.flatnonzero(labels != largest).tolist():
+        dist_sq = ((points - points[i]) ** 2).sum(axis=1)
+        for j in np.flatnonzero((dist_sq == heaviest) & (labels != labels[i])).tolist():
+            tied.add((min(i, j), max(i, j)))
+    tied = sorted(tied)
+    last = uf.union_many([i for i, _ in tied], [j for _, j in tied], target=1)
+    if last < 0:
+        return 0
+    i, j = tied[last]
+    return int(points[i, 0]) * int(points[j, 0])
+
+@profiled
+def solve_part2(input_data):
+    return last_connection_product(parse_input(input_data))
+
 if __name__ == "__main__":
     print("--- Day 8: Playground ---")
     
@@ -148,10 +275,13 @@ if __name__ == "__main__":
     p2_ex = solve_part2(example_input)
     print(f"Part 2 Example: {p2_ex} (Expected 25272)")
     
-    if p1_ex == 40 and p2_ex == 25272:
+    p2_ex_prim = last_connection_product_prim(parse_points(example_input))
+    print(f"Part 2 Example (Prim): {p2_ex_prim} (Expected 25272)")
+    
+    if p1_ex == 40 and p2_ex == 25272 and p2_ex_prim == 25272:
         print("\n--- Solving Real Input ---")
-        input_data = read_lines(8)
-        print(f"Part 1 Answer: {solve_part1(input_data, 1000)}")
-        print(f"Part 2 Answer: {solve_part2(input_data)}")
+        coords = load_parsed(8, parse_points)
+        print(f"Part 1 Answer: {multiply_largest_circuits(coords, 1000)}")
+        print(f"Part 2 Answer: {last_connection_product_prim(coords)}")
     else:
         print(f"Verification FAILED.")
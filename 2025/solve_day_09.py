@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import sys
-from utils.inputs import read_lines
+from utils.parse_cache import load_parsed
+from utils.profiling import profiled
 
-def solve(input_data):
+@profiled
+def parse_input(input_data):
     coords = []
     for line in input_data:
         line = line.strip()
@@ -13,29 +15,107 @@ def solve(input_data):
             coords.append((x, y))
         except ValueError:
             continue
-            
-    if not coords:
-        return 0
-        
-    max_area = 0
-    n = len(coords)
+    return coords
+
+# --- Staircase pruning (Part 1) ---
+# For the best pair, one corner is lower-left of the other or upper-left of it.
+# In the first case swapping the lower-left corner for any tile further down
+# and left only grows the rectangle, so it can be taken from the lower-left
+# staircase (tiles with no other tile below-left of them) and its partner from
+# the upper-right one; likewise upper-left with lower-right. On round polygons
+# a staircase still holds about a quarter of the tiles, so the pairs are not
+# all tried: along the staircases the best partner only ever moves right (the
+# same total monotonicity as ICPC WF 2017 "Money for Nothing"), which a
+# divide-and-conquer over the rows exploits.
+
+def staircases(points):
+    """Index arrays of the lower-left, upper-right, upper-left and lower-right staircases.
     
-    # Iterate all pairs
-    for i in range(n):
-        for j in range(i + 1, n):
-            x1, y1 = coords[i]
-            x2, y2 = coords[j]
-            
-            # Opposing corners
-            width = abs(x1 - x2) + 1
-            height = abs(y1 - y2) + 1
-            area = width * height
-            
-            if area > max_area:
-                max_area = area
-                
-    return max_area
+    A tile is on the lower-left staircase when no other tile lies below-left of
+    it (x and y both <=), and likewise for the other three corners.
+    """
+    import numpy as np
+    
+    xs, ys = points[:, 0], points[:, 1]
+    
+    def keep_lowest(order, sign):
+        # Walking in `order`, keep a tile that is strictly beyond every tile before it
+        walked = sign * ys[order]
+        before = np.minimum.accumulate(np.concatenate(([np.iinfo(np.int64).max], walked[:-1])))
+        return order[walked < before]
+    
+    # Walking (x, y) ascending gives the lower-left staircase and walking it
+    # backwards the upper-right one; (x ascending, y descending) gives the other two
+    x_key = xs - xs.min()
+    y_key = ys - ys.min()
+    span = int(y_key.max()) + 1
+    if (int(x_key.max()) + 1) * span < 1 << 62:
+        # One combined int64 key sorts much faster than lexsort
+        by_y_up = np.argsort(x_key * span + y_key, kind='stable')
+        by_y_down = np.argsort(x_key * span + (span - 1 - y_key), kind='stable')
+    else:
+        by_y_up = np.lexsort((ys, xs))
+        by_y_down = np.lexsort((-ys, xs))
+    return (keep_lowest(by_y_up, 1), keep_lowest(by_y_up[::-1], -1),
+            keep_lowest(by_y_down, -1), keep_lowest(by_y_down[::-1], 1))
+
+def max_dominating_area(lows, highs):
+    """Largest rectangle with its lower-left corner in lows and its upper-right corner in highs.
+    
+    lows and highs are staircases (y falls as x grows). Row i of the implied
+    area matrix is a tile of lows and its best column never moves left as i
+    grows, so the middle row of each pending range is scanned over its allowed
+    columns and splits the columns for the rows above and below it. All ranges
+    of one recursion level are scanned in a single vectorized pass, which is
+    O(len(lows) + len(highs)) work per level and O(log len(lows)) levels.
+    """
+    import numpy as np
+    
+    lows = lows[np.argsort(lows[:, 0], kind='stable')]
+    highs = highs[np.argsort(highs[:, 0], kind='stable')]
+    # Pending row ranges [lo, hi] and the column ranges [opt_lo, opt_hi] holding their best partners
+    lo, hi = np.array([0]), np.array([len(lows) - 1])
+    opt_lo, opt_hi = np.array([0]), np.array([len(highs) - 1])
+    best = 0
+    while len(lo):
+        mid = (lo + hi) // 2
+        lens = opt_hi - opt_lo + 1
+        offsets = np.cumsum(lens) - lens
+        cols = np.arange(int(lens.sum())) - np.repeat(offsets - opt_lo, lens)
+        rows = np.repeat(mid, lens)
+        width = highs[cols, 0] - lows[rows, 0] + 1
+        height = highs[cols, 1] - lows[rows, 1] + 1
+        # Pairs where highs isn't up-right of lows rank below every real rectangle
+        area = np.where((width > 0) & (height > 0), width * height, -1)
+        row_best = np.maximum.reduceat(area, offsets)
+        best = max(best, int(row_best.max()))
+        # Leftmost column reaching each row's best
+        hits = np.flatnonzero(area == np.repeat(row_best, lens))
+        opt = cols[hits[np.searchsorted(hits, offsets)]]
+        below, above = mid > lo, mid < hi
+        lo = np.concatenate((lo[below], mid[above] + 1))
+        hi = np.concatenate((mid[below] - 1, hi[above]))
+        opt_lo, opt_hi = np.concatenate((opt_lo[below], opt[above])), np.concatenate((opt[below], opt_hi[above]))
+    return best
+
+@profiled
+def largest_rectangle(coords):
+    import numpy as np
+    
+    if len(coords) < 2:
+        return 0
+    points = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+    lower_left, upper_right, upper_left, lower_right = (points[idx] for idx in staircases(points))
+    # Mirroring y turns the upper-left/lower-right pairing into a lower-left/upper-right one
+    flip = np.array([1, -1])
+    return max(max_dominating_area(lower_left, upper_right),
+               max_dominating_area(upper_left * flip, lower_right * flip))
+
+@profiled
+def solve(input_data):
+    return largest_rectangle(parse_input(input_data))
 
+@profiled
 def is_point_in_or_on_poly(pt, edges):
     px, py = pt
     # If point is on an edge, it's valid
@@ -67,18 +147,8 @@ def is_point_in_or_on_poly(pt, edges):
                     
     return inside
 
-def solve_part2(input_data):
-    coords = []
-    for line in input_data:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            x, y = map(int, line.split(','))
-            coords.append((x, y))
-        except ValueError:
-            continue
-            
+@profiled
+def largest_inside_rectangle(coords):
     if not coords:
         return 0
         
@@ -143,6 +213,115 @@ def solve_part2(input_data):
             
     return 0
 
+# --- Compressed containment oracle (Part 2) ---
+# Polygon edges only run along the vertices' x and y values, so the grid cells
+# between consecutive distinct x's and y's are each entirely inside or entirely
+# outside. They are rasterized once by parity of the vertical edges crossed;
+# a 2D prefix sum over them then tells whether a rectangle is fully inside in
+# O(1): it is exactly when every cell it covers is inside. solve_part2 uses
+# it; largest_inside_rectangle above is kept as the edge-scanning reference.
+# Like that reference, this treats the polygon as a continuous region through
+# the tile centres.
+
+class PolygonOracle:
+    def __init__(self, coords):
+        import numpy as np
+        
+        points = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+        self.xs = np.unique(points[:, 0])
+        self.ys = np.unique(points[:, 1])
+        self.ix = np.searchsorted(self.xs, points[:, 0])
+        self.iy = np.searchsorted(self.ys, points[:, 1])
+        
+        # Each vertical edge flips the parity of the y bands it spans, at its x
+        following = np.roll(np.arange(len(points)), -1)
+        vertical = self.ix == self.ix[following]
+        low = np.minimum(self.iy, self.iy[following])[vertical]
+        high = np.maximum(self.iy, self.iy[following])[vertical]
+        column = self.ix[vertical]
+        flips = np.zeros((len(self.ys), len(self.xs)), dtype=np.uint8)
+        np.bitwise_xor.at(flips, (low, column), 1)
+        np.bitwise_xor.at(flips, (high, column), 1)
+        crossings = np.bitwise_xor.accumulate(flips, axis=0)
+        # Cell (band l, column k) sits between ys[l]..ys[l+1] and xs[k]..xs[k+1]
+        self.inside = np.bitwise_xor.accumulate(crossings, axis=1)[:-1, :-1]
+        
+        dtype = np.int32 if self.inside.size < 1 << 31 else np.int64
+        self.prefix = np.zeros((len(self.ys), len(self.xs)), dtype=dtype)
+        self.prefix[1:, 1:] = self.inside.cumsum(axis=0, dtype=dtype).cumsum(axis=1, dtype=dtype)
+        self._lines = None
+        
+    def covers(self, x_lo, x_hi, y_lo, y_hi):
+        """Whether the compressed-index rectangles (lo < hi on both axes) are fully inside."""
+        p = self.prefix
+        inside = p[y_hi, x_hi] - p[y_lo, x_hi] - p[y_hi, x_lo] + p[y_lo, x_lo]
+        return inside == (x_hi - x_lo) * (y_hi - y_lo)
+        
+    def covers_segment(self, x_lo, x_hi, y_lo, y_hi):
+        """Same for one-tile-thick rectangles (x_lo == x_hi or y_lo == y_hi)."""
+        import numpy as np
+        
+        if self._lines is None:
+            # A piece of a grid line is inside (or on the boundary) when a cell on either side is inside
+            padded = np.pad(self.inside, 1)
+            rows = (padded[:-1, 1:-1] | padded[1:, 1:-1]).cumsum(axis=1)
+            cols = (padded[1:-1, :-1] | padded[1:-1, 1:]).cumsum(axis=0)
+            self._lines = np.pad(rows, ((0, 0), (1, 0))), np.pad(cols, ((1, 0), (0, 0)))
+        rows, cols = self._lines
+        flat = y_lo == y_hi
+        along_x = rows[y_lo, x_hi] - rows[y_lo, x_lo] == x_hi - x_lo
+        along_y = cols[y_hi, x_lo] - cols[y_lo, x_lo] == y_hi - y_lo
+        return np.where(flat, along_x, along_y)
+
+@profiled
+def largest_inside_rectangle_oracle(coords, block=1 << 20):
+    """Same answer as largest_inside_rectangle, checking every pair of red tiles against a PolygonOracle."""
+    import numpy as np
+    
+    n = len(coords)
+    if n < 2:
+        return 0
+    oracle = PolygonOracle(coords)
+    points = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+    
+    xs, ys = points[:, 0], points[:, 1]
+    
+    def pairs(floor):
+        """Yields (area, x_lo, x_hi, y_lo, y_hi) for pairs i < j larger than floor(), a block of rows at a time."""
+        rows = max(1, block // n)
+        for start in range(0, n - 1, rows):
+            i = np.arange(start, min(start + rows, n - 1))[:, None]
+            j = np.arange(start + 1, n)[None, :]
+            area = (np.abs(xs[i] - xs[j]) + 1) * (np.abs(ys[i] - ys[j]) + 1)
+            # Pairs that can't beat the best so far never reach the oracle
+            i, j = np.nonzero((j > i) & (area > floor()))
+            area = area[i, j]
+            i, j = i + start, j + start + 1
+            x_lo, x_hi = np.minimum(oracle.ix[i], oracle.ix[j]), np.maximum(oracle.ix[i], oracle.ix[j])
+            y_lo, y_hi = np.minimum(oracle.iy[i], oracle.iy[j]), np.maximum(oracle.iy[i], oracle.iy[j])
+            yield area, x_lo, x_hi, y_lo, y_hi
+            
+    best = 0
+    for area, x_lo, x_hi, y_lo, y_hi in pairs(lambda: best):
+        solid = (x_lo < x_hi) & (y_lo < y_hi)
+        ok = oracle.covers(x_lo[solid], x_hi[solid], y_lo[solid], y_hi[solid])
+        if ok.any():
+            best = max(best, int(area[solid][ok].max()))
+            
+    # One-tile-thick rectangles can only win if nothing wider fits
+    spans = points.max(axis=0) - points.min(axis=0) + 1
+    if best < int(spans.max()):
+        for area, x_lo, x_hi, y_lo, y_hi in pairs(lambda: best):
+            thin = (x_lo == x_hi) | (y_lo == y_hi)
+            ok = oracle.covers_segment(x_lo[thin], x_hi[thin], y_lo[thin], y_hi[thin])
+            if ok.any():
+                best = max(best, int(area[thin][ok].max()))
+    return best
+
+@profiled
+def solve_part2(input_data):
+    return largest_inside_rectangle_oracle(parse_input(input_data))
+
 if __name__ == "__main__":
     print("--- Day 9: Movie Theater ---")
     
@@ -161,9 +340,12 @@ if __name__ == "__main__":
     print(f"Part 1 Example: {solve(example_input)}")
     print(f"Part 2 Example: {solve_part2(example_input)}")
     
-    if solve_part2(example_input) == 24:
-        input_data = read_lines(9)
-        print(f"Part 1 Result: {solve(input_data)}")
-        print(f"Part 2 Result: {solve_part2(input_data)}")
+    p2_ex_reference = largest_inside_rectangle(parse_input(example_input))
+    print(f"Part 2 Example (edge-scan reference): {p2_ex_reference}")
+    
+    if solve_part2(example_input) == 24 and p2_ex_reference == 24:
+        coords = load_parsed(9, parse_input)
+        print(f"Part 1 Result: {largest_rectangle(coords)}")
+        print(f"Part 2 Result: {largest_inside_rectangle_oracle(coords)}")
     else:
         print("Part 2 Example Verification FAILED")
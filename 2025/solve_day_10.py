@@ -2,16 +2,42 @@
 import sys
 import collections
 import re
-import numpy as np
-from scipy.optimize import milp, LinearConstraint, Bounds
-from utils.inputs import read_lines
+from utils.parse_cache import load_parsed
+from utils.profiling import profiled
 
-def solve_machine(line):
-    # Parse target: [...]
+def parse_machine(line):
+    # Format: [.##.] (3) (1,3) (2) ... {3,5,4,7}
+    # Returns (light pattern, button wirings, joltage targets); missing parts are None
     match_target = re.search(r'\[([.#]+)\]', line)
-    if not match_target:
+    target_str = match_target.group(1) if match_target else None
+    
+    # Regex for buttons: \(([\d,]+)\)
+    buttons = []
+    for match in re.findall(r'\(([\d,]+)\)', line):
+        buttons.append([int(p) for p in match.split(',') if p.strip()])
+        
+    match_joltage = re.search(r'\{([\d,]+)\}', line)
+    joltages = None
+    if match_joltage:
+        joltages = [int(p) for p in match_joltage.group(1).split(',') if p.strip()]
+        
+    return target_str, buttons, joltages
+
+@profiled
+def parse_input(input_data):
+    machines = []
+    for line in input_data:
+        line = line.strip()
+        if not line:
+            continue
+        machines.append(parse_machine(line))
+    return machines
+
+@profiled
+def solve_machine(machine):
+    target_str, button_wirings, _ = machine
+    if not target_str:
         return 0
-    target_str = match_target.group(1)
     num_lights = len(target_str)
     
     target_mask = 0
@@ -19,29 +45,12 @@ def solve_machine(line):
         if char == '#':
             target_mask |= (1 << i)
             
-    # Parse buttons: (...)
-    # There can be multiple buttons.
-    # We can split by ')' to get chunks, then find (...) in each.
-    # Or just find all (...) matches.
-    
-    # The format is [...] (...) (...) ... {...}
-    # Let's extract all (...) parts.
-    
-    # Regex for buttons: \(([\d,]+)\)
-    button_matches = re.findall(r'\(([\d,]+)\)', line)
-    
     buttons = []
-    for match in button_matches:
-        parts = match.split(',')
+    for wiring in button_wirings:
         mask = 0
-        for p in parts:
-            if p.strip():
-                try:
-                    bit = int(p.strip())
-                    if bit < num_lights:
-                        mask |= (1 << bit)
-                except ValueError:
-                    pass
+        for bit in wiring:
+            if bit < num_lights:
+                mask |= (1 << bit)
         buttons.append(mask)
         
     # BFS
@@ -64,30 +73,24 @@ def solve_machine(line):
                 
     return 0 # Should effectively not happen based on problem, or unsolvable
     
-def solve_machine_part2(line):
-    # Parse joltage target: {...}
-    match_joltage = re.search(r'\{([\d,]+)\}', line)
-    if not match_joltage:
+@profiled
+def solve_machine_part2(machine):
+    # Deferred: scipy.optimize alone takes ~0.5s to import and Part 1 is a plain BFS
+    import numpy as np
+    from scipy.optimize import milp, LinearConstraint, Bounds
+    
+    _, button_wirings, target_parts = machine
+    if not target_parts:
         return 0
-    target_parts = [int(p) for p in match_joltage.group(1).split(',')]
     b = np.array(target_parts)
     num_counters = len(b)
     
-    # Parse buttons: (...)
-    button_matches = re.findall(r'\(([\d,]+)\)', line)
-    
     A_cols = []
-    for match in button_matches:
-        parts = match.split(',')
+    for wiring in button_wirings:
         col = np.zeros(num_counters)
-        for p in parts:
-            if p.strip():
-                try:
-                    idx = int(p.strip())
-                    if idx < num_counters:
-                        col[idx] = 1
-                except ValueError:
-                    pass
+        for idx in wiring:
+            if idx < num_counters:
+                col[idx] = 1
         A_cols.append(col)
         
     if not A_cols:
@@ -122,15 +125,13 @@ def solve_machine_part2(line):
         # Fallback? Maybe unfeasible.
         return 0
 
-def solve(input_data):
+@profiled
+def total_light_presses(machines):
     total_presses = 0
     machine_count = 0
-    for line in input_data:
-        line = line.strip()
-        if not line:
-            continue
+    for machine in machines:
         try:
-            presses = solve_machine(line)
+            presses = solve_machine(machine)
             total_presses += presses
             machine_count += 1
         except Exception as e:
@@ -138,20 +139,26 @@ def solve(input_data):
             
     return total_presses
 
-def solve_part2(input_data):
+@profiled
+def solve(input_data):
+    return total_light_presses(parse_input(input_data))
+
+@profiled
+def total_joltage_presses(machines):
     total_presses = 0
-    for line in input_data:
-        line = line.strip()
-        if not line:
-            continue
+    for machine in machines:
         try:
-            presses = solve_machine_part2(line)
+            presses = solve_machine_part2(machine)
             total_presses += presses
         except Exception as e:
-            print(f"Part 2 Error on line: {line}\n{e}")
+            print(f"Part 2 Error on machine: {machine}\n{e}")
             
     return total_presses
 
+@profiled
+def solve_part2(input_data):
+    return total_joltage_presses(parse_input(input_data))
+
 if __name__ == "__main__":
     print("--- Day 10: Factory ---")
     
@@ -170,9 +177,9 @@ if __name__ == "__main__":
     try:
         print(f"Part 2 Example: {solve_part2(example_input)}")
         
-        input_data = read_lines(10)
-        print(f"Part 1 Result: {solve(input_data)}")
-        print(f"Part 2 Result: {solve_part2(input_data)}")
+        machines = load_parsed(10, parse_input)
+        print(f"Part 1 Result: {total_light_presses(machines)}")
+        print(f"Part 2 Result: {total_joltage_presses(machines)}")
         
     except Exception as e:
         print(f"Execution Error: {e}")
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import sys
 import collections
-from utils.inputs import read_lines
+from utils.inputs import iter_lines
+from utils.profiling import profiled
 
 # Increase recursion depth just in case, though graph shouldn't be that deep
 sys.setrecursionlimit(20000)
 
+@profiled
 def solve(input_data):
     adj = collections.defaultdict(list)
     
@@ -27,6 +29,7 @@ def solve(input_data):
             
     memo = {}
     
+    @profiled
     def count_paths(node, target):
         # Base case
         if node == target:
@@ -120,8 +123,7 @@ if __name__ == "__main__":
 
     if p1_ex1 == 5 and p2_ex2 == 2:
         print("Examples Verified!")
-        input_data = read_lines(11)
-        p1, p2 = solve(input_data)
+        p1, p2 = solve(iter_lines(11))
         print(f"Part 1 Result: {p1}")
         print(f"Part 2 Result: {p2}")
     else:
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import sys
 import collections
+from utils.profiling import enabled as profiling_enabled, profiled
 
 # --- Shape Logic ---
 
@@ -89,9 +90,6 @@ class Shape:
         # Actually random order is fine, but fewer variations is better.
         self.variations = unique_vars
 
-import multiprocessing
-import signal
-
 def solve_region_wrapper(args):
     W, H, pieces, shapes_data = args
     # Reconstruct shapes? No, we need fresh cache or something.
@@ -116,6 +114,7 @@ def get_bitmask(coords, W):
         mask |= (1 << (r * W + c))
     return mask
 
+@profiled
 def solve_region_with_limit(W, H, pieces, shapes, max_steps=50000):
     # Same code as solve_region but with step decrement
     n_pieces = len(pieces)
@@ -183,6 +182,7 @@ def solve_region_with_limit(W, H, pieces, shapes, max_steps=50000):
     
     steps = 0
     
+    @profiled
     def backtrack(p_idx, grid_mask, start_pos=0):
         nonlocal steps
         steps += 1
@@ -221,6 +221,7 @@ def solve_region_with_limit(W, H, pieces, shapes, max_steps=50000):
 
     return backtrack(0, 0)
 
+@profiled
 def worker(task_data):
     W, H, counts, shapes_dict = task_data
     # Reconstruct pieces
@@ -238,7 +239,9 @@ def worker(task_data):
     return solve_region_with_limit(W, H, pieces, shapes_dict)
 
 
+@profiled
 def parse_input(lines):
+    lines = list(lines)
     shapes = {}
     current_idx = None
     current_grid = []
@@ -273,26 +276,39 @@ def parse_input(lines):
     if current_idx is not None and current_grid:
         shapes[current_idx] = Shape(current_idx, current_grid)
         
-    return shapes, query_lines
-
-def solve_all(input_data):
-    shapes, queries = parse_input(input_data)
-    
-    tasks = []
-    for line in queries:
+    # Parse Queries: "WxH: count0 count1 ..."
+    queries = []
+    for line in query_lines:
         line = line.strip()
         if not line: continue
         parts = line.split(':')
         dims = parts[0].split('x')
         W, H = int(dims[0]), int(dims[1])
         counts = list(map(int, parts[1].strip().split()))
-        tasks.append((W, H, counts, shapes))
+        queries.append((W, H, counts))
         
-    with multiprocessing.Pool() as pool:
-        results = pool.map(worker, tasks)
+    return shapes, queries
+
+@profiled
+def count_fitting_regions(shapes, queries):
+    tasks = [(W, H, counts, shapes) for W, H, counts in queries]
+        
+    if profiling_enabled:
+        # Pool workers are killed without running exit hooks, so their
+        # profile would be lost. Stay in-process while profiling.
+        results = list(map(worker, tasks))
+    else:
+        import multiprocessing
+        with multiprocessing.Pool() as pool:
+            results = pool.map(worker, tasks)
         
     return sum(results)
 
+@profiled
+def solve_all(input_data):
+    shapes, queries = parse_input(input_data)
+    return count_fitting_regions(shapes, queries)
+
 if __name__ == "__main__":
     print("--- Day 12: Christmas Tree Farm ---")
     
@@ -312,14 +328,12 @@ if __name__ == "__main__":
     print(f"Example 3: {worker((12, 5, [1,0,1,0,3,2], example_shapes))}") # Should be False
     
     print("Running on input file...")
-    from utils.inputs import read_lines
-    input_lines = read_lines(12)
-    # Filter blank lines - NO, parser depends on them!
-    # input_lines = [l for l in input_lines if l.strip()]
+    from utils.parse_cache import load_parsed
+    # Blank lines are kept, the shape parser depends on them
+    shapes, queries = load_parsed(12, parse_input)
     
-    # Note: solve_all parses again, but that's fine.
     try:
-        result = solve_all(input_lines)
+        result = count_fitting_regions(shapes, queries)
         print(f"Result: {result}")
     except Exception as e:
         import traceback
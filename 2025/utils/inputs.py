@@ -1,8 +1,18 @@
+import mmap
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
+# Point this at another directory with the same day_XX.txt layout (e.g. one
+# written by `python -m generators`) to run every solver on it unchanged.
+INPUTS_DIR_ENV = "AOC_INPUTS_DIR"
+
 def get_input_path(day_number: int) -> Path:
     """Returns the path to the input file for the given day."""
     # Assuming inputs are stored in 'inputs/day_XX.txt'
+    inputs_dir = os.environ.get(INPUTS_DIR_ENV)
+    if inputs_dir:
+        return Path(inputs_dir) / f"day_{day_number:02d}.txt"
     root_dir = Path(__file__).parent.parent
     return root_dir / "inputs" / f"day_{day_number:02d}.txt"
 
@@ -13,3 +23,82 @@ def read_text(day_number: int) -> str:
 def read_lines(day_number: int) -> list[str]:
     """Reads the input file for the given day as a list of lines."""
     return read_text(day_number).splitlines()
+
+# --- Streaming access ---
+# The functions below never hold more than one line / chunk of the file as
+# Python objects, so they are safe to use on multi-gigabyte inputs.
+
+def _open_mmap(path: Path) -> mmap.mmap | None:
+    # mmap refuses zero-length files, callers treat None as "empty input"
+    with path.open('rb') as f:
+        if f.seek(0, 2) == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def iter_lines(day_number: int) -> Iterator[str]:
+    """Lazily yields the lines of the input file for the given day (without line endings)."""
+    mm = _open_mmap(get_input_path(day_number))
+    if mm is None:
+        return
+    with mm:
+        for raw in iter(mm.readline, b''):
+            yield raw.rstrip(b'\r\n').decode()
+
+def iter_chunks(day_number: int, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """Yields the input file for the given day in chunks of about chunk_size bytes.
+
+    Every chunk except possibly the last ends on a newline, so no line is ever
+    split across two chunks. A single line longer than chunk_size is returned whole.
+    """
+    mm = _open_mmap(get_input_path(day_number))
+    if mm is None:
+        return
+    with mm:
+        start = 0
+        size = len(mm)
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                cut = mm.rfind(b'\n', start, end)
+                if cut == -1:
+                    cut = mm.find(b'\n', end)
+                end = size if cut == -1 else cut + 1
+            yield mm[start:end]
+            start = end
+
+def iter_column_windows(day_number: int, width: int = 1 << 16) -> Iterator[list[bytes]]:
+    """Yields the non-empty lines of the input side by side, width columns at a time.
+
+    Each window is a list with one bytes slice per line, padded with spaces to
+    the same length. Meant for inputs made of a few extremely long lines, where
+    a line-at-a-time reader would still have to hold whole lines.
+    """
+    mm = _open_mmap(get_input_path(day_number))
+    if mm is None:
+        return
+    with mm:
+        bounds = []
+        start = 0
+        while start < len(mm):
+            end = mm.find(b'\n', start)
+            if end == -1:
+                end = len(mm)
+            stop = end - 1 if end > start and mm[end - 1] == ord('\r') else end
+            if stop > start:
+                bounds.append((start, stop))
+            start = end + 1
+        longest = max((stop - start for start, stop in bounds), default=0)
+        for col in range(0, longest, width):
+            size = min(width, longest - col)
+            yield [mm[start + col:min(start + col + size, stop)].ljust(size) for start, stop in bounds]
+
+def read_view(day_number: int) -> memoryview:
+    """Returns a read-only, zero-copy memoryview over the input file for the given day.
+
+    The underlying mapping stays open for as long as the view (or any slice of it)
+    is alive; call .release() on it to unmap early.
+    """
+    mm = _open_mmap(get_input_path(day_number))
+    if mm is None:
+        return memoryview(b'')
+    return memoryview(mm)
@@ -0,0 +1,99 @@
+"""Binary cache of parsed puzzle inputs.
+
+`load_parsed(day, parse)` runs `parse(iter_lines(day))` once and stores the
+result under `.parsed/` in the inputs directory. Later calls load it back
+instead of re-parsing the text. Integer NumPy arrays are written as `.npy`,
+anything else as a pickle. The cache is valid while the input file's mtime
+and size are unchanged. If the mtime moved, the SHA-256 of the content decides,
+so touching or re-downloading an identical file does not trigger a re-parse.
+"""
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+from utils.inputs import get_input_path, iter_lines
+
+# Bump when the on-disk layout written below changes
+CACHE_FORMAT = 1
+CACHE_DIR_NAME = ".parsed"
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _is_int_array(value) -> bool:
+    # Only look for ndarrays if numpy is already loaded, so pickle-only days
+    # don't pay for importing it.
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(value, np.ndarray) and value.dtype.kind in 'iu'
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _meta_is_fresh(meta: dict, input_path: Path) -> bool:
+    st = input_path.stat()
+    if meta.get('format') != CACHE_FORMAT or meta.get('size') != st.st_size:
+        return False
+    if meta.get('mtime_ns') == st.st_mtime_ns:
+        return True
+    return meta.get('sha256') == _sha256(input_path)
+
+def load_parsed(day_number: int, parse, version: int = 1, name: str | None = None):
+    """Returns parse(iter_lines(day_number)), served from the binary cache when possible.
+
+    Bump `version` whenever the parser's output changes shape so old entries are ignored.
+    """
+    input_path = get_input_path(day_number)
+    cache_dir = input_path.parent / CACHE_DIR_NAME
+    base = f"{input_path.stem}.{name or parse.__name__}.v{version}"
+    meta_path = cache_dir / f"{base}.json"
+
+    if meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+            if _meta_is_fresh(meta, input_path):
+                data_path = cache_dir / f"{base}.{meta['kind']}"
+                if meta['kind'] == 'npy':
+                    import numpy as np
+                    value = np.load(data_path, allow_pickle=False)
+                else:
+                    with data_path.open('rb') as f:
+                        value = pickle.load(f)
+                if meta.get('mtime_ns') != input_path.stat().st_mtime_ns:
+                    # Same content under a new mtime, skip the hash next time
+                    meta['mtime_ns'] = input_path.stat().st_mtime_ns
+                    _write_atomic(meta_path, json.dumps(meta).encode())
+                return value
+        except Exception:
+            # Corrupt or unreadable (e.g. pickled classes that moved): re-parse
+            pass
+
+    value = parse(iter_lines(day_number))
+
+    st = input_path.stat()
+    cache_dir.mkdir(exist_ok=True)
+    if _is_int_array(value):
+        import numpy as np
+        buf = io.BytesIO()
+        np.save(buf, value, allow_pickle=False)
+        kind, payload = 'npy', buf.getvalue()
+    else:
+        kind, payload = 'pickle', pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    _write_atomic(cache_dir / f"{base}.{kind}", payload)
+    _write_atomic(meta_path, json.dumps({
+        'format': CACHE_FORMAT,
+        'kind': kind,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'sha256': _sha256(input_path),
+    }).encode())
+    return value
@@ -0,0 +1,119 @@
+"""Opt-in hot-path instrumentation for the solvers.
+
+Decorate a function with `@profiled` to have it counted when the AOC_PROFILE
+environment variable is set:
+
+    AOC_PROFILE=1 python solve_day_04.py                 # writes profile.folded
+    AOC_PROFILE=day04.folded python solve_day_04.py
+
+For every decorated function this records the call count, cumulative wall time
+and the net change in traced memory (tracemalloc). At exit a summary table goes
+to stderr and the self time of each decorated call stack is written in the
+collapsed-stack format read by flamegraph.pl / speedscope, in microseconds.
+Direct recursion is folded into a single frame so deep searches stay readable.
+tracemalloc slows allocation-heavy code a lot; set AOC_PROFILE_MEMORY=0 to
+record times only.
+
+When AOC_PROFILE is unset `profiled` returns the function itself, so there is
+no wrapper and no per-call cost at all.
+"""
+import atexit
+import functools
+import os
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+
+PROFILE_ENV = "AOC_PROFILE"
+MEMORY_ENV = "AOC_PROFILE_MEMORY"
+DEFAULT_OUTPUT = "profile.folded"
+
+_setting = os.environ.get(PROFILE_ENV, "")
+enabled = _setting.lower() not in ("", "0", "false", "no")
+trace_memory = enabled and os.environ.get(MEMORY_ENV, "1").lower() not in ("0", "false", "no")
+
+# name -> [calls, cumulative seconds, net allocated bytes]
+_stats = defaultdict(lambda: [0, 0.0, 0])
+# "outer;inner;leaf" -> self seconds
+_folded = defaultdict(float)
+# Active frames, each [name, recursion depth, seconds spent in children]
+_stack = []
+_active = defaultdict(int)
+
+def _frame_name(func):
+    return f"{Path(func.__code__.co_filename).stem}:{func.__qualname__.replace('.<locals>', '')}"
+
+def profiled(func):
+    """Records calls, time and allocations of func while profiling is enabled."""
+    if not enabled:
+        return func
+
+    name = _frame_name(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        entered = time.perf_counter()
+        stat = _stats[name]
+        stat[0] += 1
+        if _stack and _stack[-1][0] == name:
+            # Direct recursion: account everything to the outermost call
+            _stack[-1][1] += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _stack[-1][1] -= 1
+
+        frame = [name, 0, 0.0]
+        _stack.append(frame)
+        _active[name] += 1
+        mem_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            mem_delta = tracemalloc.get_traced_memory()[0] - mem_before
+            _stack.pop()
+            _active[name] -= 1
+            if not _active[name]:
+                # Only the outermost activation counts, so mutual recursion isn't double counted
+                stat[1] += elapsed
+                stat[2] += mem_delta
+            path = ';'.join(f[0] for f in _stack)
+            _folded[f"{path};{name}" if path else name] += elapsed - frame[2]
+            if _stack:
+                # Charge this wrapper's own bookkeeping to the child as well,
+                # so the caller's self time isn't inflated by profiling overhead
+                _stack[-1][2] += time.perf_counter() - entered
+
+    return wrapper
+
+def report(out=sys.stderr):
+    """Prints the per-function summary table."""
+    if not _stats:
+        return
+    print(f"\n{'function':<48} {'calls':>12} {'cum ms':>12} {'alloc KiB':>12}", file=out)
+    for name, (calls, seconds, alloc) in sorted(_stats.items(), key=lambda kv: -kv[1][1]):
+        print(f"{name:<48} {calls:>12,} {seconds * 1000:>12.2f} {alloc / 1024:>12.1f}", file=out)
+
+def dump_folded(path: Path):
+    """Writes the collapsed stacks (weights in whole microseconds)."""
+    with open(path, 'w') as f:
+        for stack, seconds in sorted(_folded.items()):
+            micros = round(seconds * 1e6)
+            if micros > 0:
+                f.write(f"{stack} {micros}\n")
+
+def _at_exit():
+    report()
+    if _folded:
+        path = Path(DEFAULT_OUTPUT if _setting.lower() in ("1", "true", "yes") else _setting)
+        dump_folded(path)
+        print(f"Collapsed stacks written to {path}", file=sys.stderr)
+
+if enabled:
+    if trace_memory:
+        tracemalloc.start()
+    atexit.register(_at_exit)
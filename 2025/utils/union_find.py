@@ -0,0 +1,75 @@
+"""Array-backed disjoint-set forest (union-find).
+
+Parents and sizes live in `array('i')` buffers instead of lists of boxed ints,
+`find` is iterative with path halving so deep trees can't hit the recursion
+limit, and `union` links by size. `union_many` runs a batch of unions and
+reports when the number of sets reaches a target; `component_sizes` resolves
+every root at once with NumPy.
+"""
+from array import array
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.num_sets = n
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            # Path halving: point every other node on the way at its grandparent
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        """Merges the sets of i and j; returns False if they were already one set."""
+        root_i = self.find(i)
+        root_j = self.find(j)
+        if root_i == root_j:
+            return False
+        if self.size[root_i] < self.size[root_j]:
+            root_i, root_j = root_j, root_i
+        self.parent[root_j] = root_i
+        self.size[root_i] += self.size[root_j]
+        self.num_sets -= 1
+        return True
+
+    def union_many(self, i_arr, j_arr, target: int | None = None) -> int:
+        """Unions the pairs (i_arr[k], j_arr[k]) in order.
+
+        With a target, stops at the first pair after which there are `target`
+        sets and returns its index k; otherwise (or if it is never reached)
+        runs every pair and returns -1.
+        """
+        if target is not None and self.num_sets == target:
+            return -1
+        # Plain ints are much faster to index array('i') with than NumPy scalars
+        if hasattr(i_arr, 'tolist'):
+            i_arr, j_arr = i_arr.tolist(), j_arr.tolist()
+        union = self.union
+        for k, (i, j) in enumerate(zip(i_arr, j_arr)):
+            if union(i, j) and self.num_sets == target:
+                return k
+        return -1
+
+    def roots(self):
+        """NumPy array with the root of every element (fully compresses the forest)."""
+        import numpy as np
+
+        parent = np.frombuffer(self.parent, dtype=np.int32).copy()
+        # Pointer jumping: each pass halves every remaining path length
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        self.parent = array('i', parent.tobytes())
+        return parent
+
+    def component_sizes(self):
+        """NumPy array with the size of every set, in no particular order."""
+        import numpy as np
+
+        sizes = np.bincount(self.roots(), minlength=len(self.parent))
+        return sizes[sizes > 0]